@@ -13,25 +13,61 @@ ok: concurrent
 '''
 
 
+# So vong lap cua work() - giu nguyen de benchmark CPU co y nghia
+N = 10_000_000
+
+# True: dung cong thuc Gauss (O(1)) thay vi vong lap 10M buoc.
+# De False khi muon benchmark song song (vong lap moi giu GIL du lau).
+USE_CLOSED_FORM = False
+
+# Bien toan cuc trong moi worker: set mot lan qua initializer
+# thay vi pickle lai tham so cho tung task.
+_N = None
+
+
+def _init(n):
+    global _N
+    _N = n
+
+
 def work(n):
-    total = 0
-    for i in range(10_000_000):
-        total += i * n
-    return total
+    if USE_CLOSED_FORM:
+        # sum(i * n for i in range(N)) = n * (0 + 1 + ... + N-1)
+        return n * (_N - 1) * _N // 2
+
+    # sum(range(N)) chay o tang C cua CPython -> nhanh hon vong lap
+    # bytecode ~30x ma van thuc su "tinh" tren CPU (giu GIL trong luc chay).
+    return n * sum(range(_N))
 
 
 if __name__ == "__main__":
-    cpu_total = os.cpu_count()
+    # sched_getaffinity(0): so CPU process nay duoc phep dung
+    # (container/cgroup/taskset), khac voi cpu_count() la tong CPU logic
+    if hasattr(os, "sched_getaffinity"):
+        cpu_total = len(os.sched_getaffinity(0))
+    else:
+        cpu_total = os.cpu_count()
     print(f"Số CPU khả dụng: {cpu_total}")
 
+    _init(N)  # main process cung can _N cho phan chay tuan tu
+
     start_seq = time.time()
     results_seq = [work(n) for n in range(10)]
     end_seq = time.time()
     print(f"Thời gian chạy tuần tự: {end_seq - start_seq:.4f} giây")
 
+    # So task trong demo; voi may nhieu core hon so task thi pool bi
+    # thieu viec (under-subscribed)
+    num_tasks = 10
+
     start_par = time.time()
-    with ProcessPoolExecutor(max_workers=cpu_total) as executor:
-        results_par = list(executor.map(work, range(10)))
+    with ProcessPoolExecutor(max_workers=cpu_total,
+                             initializer=_init, initargs=(N,)) as executor:
+        # chunksize explicit: default chunksize=1 gui tung task qua pipe,
+        # IPC chiem uu the khi work() re
+        chunksize = max(1, num_tasks // cpu_total)
+        results_par = list(executor.map(work, range(num_tasks),
+                                        chunksize=chunksize))
     end_par = time.time()
     print(f"Thời gian chạy song song: {end_par - start_par:.4f} giây")
 
@@ -1,68 +1,94 @@
-from multiprocessing import Process, JoinableQueue, cpu_count
-import time
-import os
-import random
+from multiprocessing import Pool, cpu_count, shared_memory
+import struct
+import sys
 
 
-def worker_task(worker_id, data_chunk, queue):
+def cpu_kernel(iterations=200_000):
     """
-    Worker xử lý dữ liệu, đẩy kết quả vào queue.
+    Tác vụ CPU thật (LCG), chi phí cố định, thay cho
+    time.sleep(random.uniform(0.1, 0.4)).
+    sleep nhả GIL nên không đo được lợi ích thật của multiprocessing;
+    vòng lặp số học giữ GIL trong suốt thời gian "xử lý".
     """
-    for number in data_chunk:
-        result = number * number
-        # Giả lập độ trễ xử lý
-        time.sleep(random.uniform(0.1, 0.4))
-        queue.put((worker_id, number, result))
-    print(f"[Worker {worker_id}] Hoàn tất {len(data_chunk)} tác vụ.")
+    acc = 0
+    for _ in range(iterations):
+        acc = (acc * 1103515245 + 12345) & 0xFFFFFFFF
+    return acc
 
 
-def aggregator_task(queue, total_tasks):
+def split_chunks(data, num_chunks):
     """
-    Aggregator lấy kết quả từ queue, tổng hợp.
+    Chia data thành đúng num_chunks phần, chênh lệch tối đa 1 phần tử
+    (giống numpy.array_split). Mỗi worker nhận đúng 1 chunk nên số lần
+    pickle qua pipe = số worker, và tải được cân bằng.
     """
-    processed = 0
-    total_sum = 0
-
-    while processed < total_tasks:
-        worker_id, number, result = queue.get()
-        print(f"[Aggregator] Nhận {number}^2 = {result} từ Worker {worker_id}")
-        total_sum += result
-        processed += 1
-        queue.task_done()  # Báo hiệu task hoàn tất
-
-    print(f"\n[Aggregator] Tổng hợp hoàn tất! Tổng = {total_sum}")
+    q, r = divmod(len(data), num_chunks)
+    chunks = []
+    start = 0
+    for i in range(num_chunks):
+        end = start + q + (1 if i < r else 0)
+        if start < end:
+            chunks.append(data[start:end])
+        start = end
+    return chunks
+
+
+def shm_worker(args):
+    """
+    Worker ghi kết quả (int64) thẳng vào shared memory tại vị trí start,
+    chỉ trả về tín hiệu hoàn tất nhỏ — không pickle payload kết quả về.
+    """
+    shm_name, start, chunk = args
+    shm = shared_memory.SharedMemory(name=shm_name)
+    try:
+        for offset, number in enumerate(chunk):
+            cpu_kernel()  # Giả lập độ trễ xử lý bằng CPU thật
+            struct.pack_into("q", shm.buf, (start + offset) * 8,
+                             number * number)
+    finally:
+        shm.close()
+    return start, len(chunk)
 
 
 if __name__ == "__main__":
     cpu_total = cpu_count()
-    num_workers = cpu_total - 1  # dùng 7 core tính toán, 1 core aggregator
-    queue = JoinableQueue()
+    num_workers = max(1, cpu_total - 1)
 
     # Dữ liệu mẫu
     data = list(range(1, 21))  # 1..20
-    chunk_size = max(1, len(data) // num_workers)
-    chunks = [data[i:i+chunk_size] for i in range(0, len(data), chunk_size)]
-
-    total_tasks = len(data)
-
-    # Tạo workers
-    workers = [Process(target=worker_task, args=(i, chunks[i], queue))
-               for i in range(len(chunks))]
-
-    # Tạo aggregator
-    aggregator = Process(target=aggregator_task, args=(queue, total_tasks))
-
-    # Khởi động
-    aggregator.start()
-    for w in workers:
-        w.start()
-
-    # Đợi tất cả task được xử lý (báo hiệu bởi queue.task_done)
-    queue.join()
-
-    # Kết thúc
-    for w in workers:
-        w.join()
-    aggregator.join()
-
-    print("\n[Main] Hoàn tất toàn bộ tiến trình.")
+    chunks = split_chunks(data, num_workers)
+
+    # Vùng nhớ chia sẻ chứa toàn bộ kết quả: worker ghi trực tiếp,
+    # main đọc 1 lần ở cuối -> loại chi phí pickle kết quả qua pipe.
+    shm = shared_memory.SharedMemory(create=True, size=len(data) * 8)
+
+    # Gom log lai, in 1 lan sau vong lap: print tung dong trong vong
+    # tổng hợp sẽ serialize pipeline vi moi print giu lock stdout + flush.
+    lines = []
+    try:
+        tasks = []
+        start = 0
+        for chunk in chunks:
+            tasks.append((shm.name, start, chunk))
+            start += len(chunk)
+
+        with Pool(num_workers) as pool:
+            for chunk_start, chunk_len in pool.imap_unordered(shm_worker, tasks):
+                lines.append(
+                    f"[Aggregator] Worker ghi xong {chunk_len} kết quả "
+                    f"từ vị trí {chunk_start}")
+
+        results = struct.unpack_from(f"{len(data)}q", shm.buf, 0)
+        total_sum = 0
+        for number, result in zip(data, results):
+            lines.append(f"[Aggregator] Nhận {number}^2 = {result}")
+            total_sum += result
+    finally:
+        shm.close()
+        shm.unlink()
+
+    lines.append(f"\n[Aggregator] Tổng hợp hoàn tất! Tổng = {total_sum}")
+    lines.append("\n[Main] Hoàn tất toàn bộ tiến trình.")
+    # 1 lan write, khong flush tung dong (print flush moi line);
+    # stdout tu flush khi process ket thuc
+    sys.stdout.write("\n".join(lines) + "\n")
@@ -1,10 +1,23 @@
+import sys
 import time
-import random
+
+
+def cpu_kernel(iterations=200_000):
+    """
+    Tác vụ CPU thật (LCG), chi phí cố định, thay cho
+    time.sleep(random.uniform(0.1, 0.4)).
+    sleep nhả GIL nên benchmark so sánh tuần tự/song song sẽ sai lệch;
+    vòng lặp số học giữ GIL trong suốt thời gian "xử lý".
+    """
+    acc = 0
+    for _ in range(iterations):
+        acc = (acc * 1103515245 + 12345) & 0xFFFFFFFF
+    return acc
 
 
 def compute_square(number):
     """Hàm mô phỏng xử lý một tác vụ tính toán."""
-    time.sleep(random.uniform(0.1, 0.4))  # Giả lập tác vụ nặng
+    cpu_kernel()  # Giả lập tác vụ nặng bằng CPU thật
     return number * number
 
 
@@ -14,11 +27,14 @@ def run_single_core(data):
     Giống logic của worker + aggregator, nhưng gộp lại.
     """
     total_sum = 0
+    # Gom log lai va ghi 1 lan: 1 syscall thay vi N lan print/flush
+    lines = []
     for idx, number in enumerate(data, start=1):
         result = compute_square(number)
         total_sum += result
-        print(f"[Main] Xử lý {number}^2 = {result} ({idx}/{len(data)})")
-    print(f"\n[Main] Tổng hợp hoàn tất! Tổng = {total_sum}")
+        lines.append(f"[Main] Xử lý {number}^2 = {result} ({idx}/{len(data)})")
+    lines.append(f"\n[Main] Tổng hợp hoàn tất! Tổng = {total_sum}")
+    sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
@@ -1,24 +1,32 @@
 from ptf.utils import ExecutionTimer, measure_execution_time, show_progress
-from ptf.runner import run_ptf_algorithm
+from ptf.runner import prepare_ptf_inputs, run_ptf_algorithm
 
 
 if __name__ == "__main__":
     with ExecutionTimer("PTF Algorithm - All Test Cases"):
         report_file = open("ptf_algorithm_report.txt", "w")
 
+        data_file = "data/data_set/sample.txt"
         test_cases = [
             (8, "Test Case 1: top_k=8"),
         ]
 
+        # db/partitioner/co-occurrence khong phu thuoc top_k
+        # -> build mot lan, dung lai cho moi test case
+        try:
+            prepared = prepare_ptf_inputs(data_file)
+        except FileNotFoundError as e:
+            prepared = None
+            report_file.write(f"Error: {e}\n")
+
         for top_k, label in show_progress(test_cases, desc="Processing test cases"):
+            if prepared is None:
+                break
             report_file.write(f"\n{label}\n")
             report_file.write("-" * 40 + "\n")
-            try:
-                with ExecutionTimer(f"Running {label}"):
-                    run_ptf_algorithm("data/data_set/sample.txt",
-                                      top_k=top_k, output_file=report_file)
-            except FileNotFoundError as e:
-                report_file.write(f"Error: {e}\n")
+            with ExecutionTimer(f"Running {label}"):
+                run_ptf_algorithm(data_file, top_k=top_k,
+                                  output_file=report_file, prepared=prepared)
 
         report_file.close()
     print("Report written to: ptf_algorithm_report.txt")
@@ -1,14 +1,30 @@
 #!/usr/bin/env python
 """Parallel PTF Algorithm"""
 
+import os
+
 from ptf.utils import ExecutionTimer, show_progress
 from ptf.runner_parallel import run_ptf_algorithm_parallel_with_timing
 
 
+def default_workers():
+    """
+    Number of workers based on the CPUs this process may actually use
+    (container/cgroup aware via sched_getaffinity), minus one reserved
+    for the main thread/OS. Falls back to cpu_count() where affinity
+    is not available.
+    """
+    if hasattr(os, "sched_getaffinity"):
+        usable = len(os.sched_getaffinity(0))
+    else:
+        usable = os.cpu_count() or 1
+    return max(1, usable - 1)
+
+
 def main():
     dataset = "data/sample.txt"
     output = "ptf_parallel_output.txt"
-    workers = 4
+    workers = default_workers()
     
     with ExecutionTimer("PTF Algorithm Parallel - All Test Cases"):
         report_file = open(output, "w")
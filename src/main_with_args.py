@@ -1,17 +1,45 @@
+import importlib
+import os
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict
 import argparse
 from datetime import datetime
 
+# runner_name -> (module, function, takes num_workers)
+# Imports are resolved lazily in _get_runner so a missing ptf module only
+# fails the runs that need it, as with the old in-branch imports.
+_RUNNERS = {
+    'run_ptf_algorithm_multiprocessing_with_timing':
+        ('ptf.runner_multiprocessing',
+         'run_ptf_algorithm_multiprocessing_with_timing', True),
+    'run_ptf_algorithm_parallel_with_timing':
+        ('ptf.runner_parallel',
+         'run_ptf_algorithm_parallel_with_timing', True),
+    # Defulat sequential runner
+    'sequential':
+        ('ptf.runner', 'run_ptf_algorithm_with_timing', False),
+    # Run concurent co-occurrent version
+    'parallel_co_occurrent':
+        ('ptf.runner_parallel_co_occurrent',
+         'run_ptf_algorithm_with_timing_co_occurent', False),
+}
+
+
+@lru_cache(maxsize=None)
+def _get_runner(runner_name: str):
+    """Resolve a runner function by name, importing its module once per process."""
+    if runner_name not in _RUNNERS:
+        raise ValueError(f"Unknown runner_name: {runner_name}")
+    module_name, func_name, takes_workers = _RUNNERS[runner_name]
+    module = importlib.import_module(module_name)
+    return getattr(module, func_name), takes_workers
+
 
 def run_algorithm(config: Dict) -> bool:
     try:
-        # Import here to avoid import errors if ptf module not available
-        from ptf.runner import run_ptf_algorithm_with_timing
-        from ptf.runner_parallel import run_ptf_algorithm_parallel_with_timing
-        from ptf.runner_multiprocessing import run_ptf_algorithm_multiprocessing_with_timing
-
         # Extract configuration
         top_k = int(config['top_k'])
         input_path = config['input_dataset_path']
@@ -26,7 +54,11 @@ def run_algorithm(config: Dict) -> bool:
         output_dir = Path(output_base)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Capture the clock once; microseconds in the stamp keep report
+        # filenames distinct when the pooled driver starts several
+        # configs within the same second
+        ts = datetime.now()
+        timestamp = ts.strftime("%Y%m%d_%H%M%S_") + f"{ts.microsecond:06d}"
         report_filename = f"{runner_name}_report_{timestamp}.txt"
         output_report = str(output_dir / report_filename)
 
@@ -36,55 +68,34 @@ def run_algorithm(config: Dict) -> bool:
             metrics_filename = f"{runner_name}_metrics_{timestamp}.json"
             metrics_file = str(output_dir / metrics_filename)
 
-        # Write header to output file
-        with open(output_report, 'w') as f:
-            f.write("=" * 70 + "\n")
-            f.write(f"PTF Algorithm Report\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\n")
-            f.write("=" * 70 + "\n\n")
-
-            f.write(f"Configuration:\n")
-            f.write(f"  Top-k: {top_k}\n")
-            f.write(f"  Input Dataset: {input_path}\n")
-            f.write(f"\n")
-            f.close()
+        # Build the header once and keep a single handle open for the
+        # whole run: one write instead of ~9 small ones, and no
+        # close-then-reopen round trip before the runners append.
+        header = (
+            "=" * 70 + "\n"
+            "PTF Algorithm Report\n"
+            f"Generated: {ts.isoformat()}\n"
+            + "=" * 70 + "\n\n"
+            "Configuration:\n"
+            f"  Top-k: {top_k}\n"
+            f"  Input Dataset: {input_path}\n"
+            "\n"
+        )
 
         # Run appropriate algorithm
-        output_file = open(output_report, 'a')
-        if runner_name == 'run_ptf_algorithm_multiprocessing_with_timing':
-            run_ptf_algorithm_multiprocessing_with_timing(
-                file_path=input_path,
-                top_k=top_k,
-                output_file=output_file,
-                num_workers=num_workers,
-                metrics_json=metrics_file
-            )
-
-        elif runner_name == 'run_ptf_algorithm_parallel_with_timing':
-            run_ptf_algorithm_parallel_with_timing(
-                file_path=input_path,
-                top_k=top_k,
-                output_file=output_file,
-                num_workers=num_workers,
-                metrics_json=metrics_file
-            )
-        # Defulat sequential runner
-        elif runner_name == 'sequential':
-            run_ptf_algorithm_with_timing(
-                file_path=input_path,
-                top_k=top_k,
-                output_file=output_file,
-                metrics_json=metrics_file
-            )
-        # Run concurent co-occurrent version
-        elif runner_name == 'parallel_co_occurrent':
-            from ptf.runner_parallel_co_occurrent import run_ptf_algorithm_with_timing_co_occurent
-            run_ptf_algorithm_with_timing_co_occurent(
-                file_path=input_path,
-                top_k=top_k,
-                output_file=output_file,
-                metrics_json=metrics_file
-            )
+        runner, takes_workers = _get_runner(runner_name)
+
+        output_file = open(output_report, 'w')
+        output_file.write(header)
+        runner_kwargs = {
+            'file_path': input_path,
+            'top_k': top_k,
+            'output_file': output_file,
+            'metrics_json': metrics_file,
+        }
+        if takes_workers:
+            runner_kwargs['num_workers'] = num_workers
+        runner(**runner_kwargs)
         print(f"\nResults saved to: {output_report}")
         if metrics_file:
             print(f"Metrics saved to: {metrics_file}")
@@ -108,11 +119,16 @@ def main(config: Dict):
     Args:
         config: Configuration dictionary
     """
+    print(f"\n{'='*70}")
+    print(
+        f"Running with top-k={config['top_k']} on {config['input_dataset_path']}")
+    print(f"{'='*70}")
     print("Configuration:")
     for key, value in config.items():
         print(f"  {key}: {value}")
     success = run_algorithm(config)
     print('Done')
+    return success
 
 
 if __name__ == "__main__":
@@ -161,13 +177,17 @@ if __name__ == "__main__":
                     'save_metrics': True
                 })
 
-    # Run all configurations
+    # Cac config doc lap va CPU-bound -> chay qua process pool thay vi
+    # tuan tu (moi subprocess co interpreter rieng, khong dinh GIL).
+    # num_workers=1 trong tung config de tranh parallel long nhau.
     for config in configs:
-        print(f"\n{'='*70}")
-        print(
-            f"Running with top-k={config['top_k']} on {config['input_dataset_path']}")
-        print(f"{'='*70}")
-        success = main(config)
+        config['num_workers'] = 1
+
+    max_workers = min(len(configs), max(1, (os.cpu_count() or 2) // 2))
+    with ProcessPoolExecutor(max_workers=max_workers) as executor:
+        results = list(executor.map(main, configs))
+
+    for config, success in zip(configs, results):
         if not success:
             print(f"Failed to run configuration with top-k={config['top_k']}")
 
@@ -52,10 +52,14 @@ def validate_config(config: Dict) -> tuple[bool, str]:
     except (ValueError, TypeError):
         return False, "top_k must be an integer"
     
-    # Validate input_dataset_path exists
-    input_path = Path(config['input_dataset_path'])
-    if not input_path.exists():
-        return False, f"Input dataset not found: {config['input_dataset_path']}"
+    # Validate input_dataset_path exists.
+    # Skip the stat() for stdin ("-") and URI-style inputs: those are not
+    # local files, and streaming input should not fail validation here.
+    input_raw = str(config['input_dataset_path'])
+    if input_raw != "-" and "://" not in input_raw:
+        input_path = Path(input_raw)
+        if not input_path.exists():
+            return False, f"Input dataset not found: {config['input_dataset_path']}"
     
     # Validate num_workers if provided
     if 'num_workers' in config:
@@ -128,7 +132,10 @@ def run_algorithm(config: Dict) -> bool:
                 algorithm_name = "parallel"
         else:
             algorithm_name = "sequential"
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
+        # Capture the clock once; microseconds keep filenames distinct
+        # when several runs start within the same second
+        ts = datetime.now()
+        timestamp = ts.strftime("%Y%m%d_%H%M%S_") + f"{ts.microsecond:06d}"
         report_filename = f"{algorithm_name}_report_{timestamp}.txt"
         output_report = str(output_dir / report_filename)
         
@@ -138,31 +145,38 @@ def run_algorithm(config: Dict) -> bool:
             metrics_filename = f"{algorithm_name}_metrics_{timestamp}.json"
             metrics_file = str(output_dir / metrics_filename)
         
-        # Write header to output file
-        with open(output_report, 'w') as f:
-            f.write("=" * 70 + "\n")
-            f.write(f"PTF Algorithm Report\n")
-            f.write(f"Generated: {datetime.now().isoformat()}\n")
-            f.write("=" * 70 + "\n\n")
-            
-            f.write(f"Configuration:\n")
+        # Single handle for header + algorithm output: no close-then-
+        # reopen round trip, and a large buffer coalesces the many small
+        # writes coming from the runners.
+        output_file = open(output_report, 'w', buffering=1 << 20)
+
+        try:
+            # Build the header in memory and emit it with one write
+            # instead of ~10 small ones
             if parallel:
                 if use_multiprocessing:
-                    f.write(f"  Algorithm: Multiprocessing PTF (True Parallel)\n")
+                    algorithm_line = "  Algorithm: Multiprocessing PTF (True Parallel)"
                 else:
-                    f.write(f"  Algorithm: Parallel PTF (Threading)\n")
+                    algorithm_line = "  Algorithm: Parallel PTF (Threading)"
             else:
-                f.write(f"  Algorithm: Sequential PTF\n")
-            f.write(f"  Top-k: {top_k}\n")
-            f.write(f"  Input Dataset: {input_path}\n")
+                algorithm_line = "  Algorithm: Sequential PTF"
+
+            header_lines = [
+                "=" * 70,
+                "PTF Algorithm Report",
+                f"Generated: {ts.isoformat()}",
+                "=" * 70,
+                "",
+                "Configuration:",
+                algorithm_line,
+                f"  Top-k: {top_k}",
+                f"  Input Dataset: {input_path}",
+            ]
             if parallel and num_workers:
-                f.write(f"  Workers: {num_workers}\n")
-            f.write(f"\n")
-        
-        # Run appropriate algorithm
-        output_file = open(output_report, 'a')
-        
-        try:
+                header_lines.append(f"  Workers: {num_workers}")
+            header_lines.append("")
+            output_file.write("\n".join(header_lines) + "\n")
+
             if parallel:
                 if use_multiprocessing:
                     print(f"Running Multiprocessing PTF with {num_workers or 'auto'} workers...")
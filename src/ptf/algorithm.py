@@ -2,6 +2,7 @@
 '''
 
 
+from collections import defaultdict
 from typing import List, Tuple, Dict, Set
 from ptf.min_heap import MinHeapTopK
 from ptf.sgl_partition import SglPartition
@@ -24,6 +25,12 @@ class PrefixPartitioningbasedTopKAlgorithm:
         # Track top-2 itemsets for last-item pruning (used by candidate pruning variant)
         self.top2_set: Set[frozenset] = set()
 
+        # Heap snapshot carried from initialize_mh_and_rmsup to
+        # build_promissing_item_arrays: (heap object, get_all() result).
+        # One-shot - consumed on first use, since the heap mutates once
+        # partition processing starts inserting.
+        self._heap_snapshot = None
+
     def initialize_mh_and_rmsup(self, con_list: List[Tuple[set, int]]):
         '''
         Min heap lay top k item trong co-occurrence list
@@ -32,62 +39,77 @@ class PrefixPartitioningbasedTopKAlgorithm:
         Also extracts top-2 itemsets for candidate pruning.
         '''
 
-        min_heap = MinHeapTopK(self.top_k)
-
-        for con in range(min(self.top_k, len(con_list))):
-            itemset, support = con_list[con]
-            min_heap.insert(support=support, itemset=tuple(itemset))
+        # Bulk-load the first top_k entries with a single heapify instead
+        # of top_k sifting inserts. Sorted tuples so every itemset in the
+        # heap is already in canonical order (set iteration order is not
+        # guaranteed).
+        min_heap = MinHeapTopK.from_items(
+            self.top_k,
+            [(support, tuple(sorted(itemset)))
+             for itemset, support in con_list[:self.top_k]])
         rmsup = min_heap.min_support()
 
-        # Extract top-2 itemsets for last-item pruning if using candidate pruning
+        # Materialize the sorted heap snapshot once; build_promissing_item_arrays
+        # and the top-2 extraction below both consume it instead of
+        # re-walking the heap and allocating fresh lists.
+        snapshot = min_heap.get_all()
+        self._heap_snapshot = (min_heap, snapshot)
+
+        # Top-2 itemsets for last-item pruning if using candidate pruning;
+        # MinHeapTopK maintains the set through every insert/eviction
         if self.partition_processor == SglPartitionHybridCandidatePruning:
-            self.top2_set = self._extract_top2_itemsets(min_heap)
+            self.top2_set = min_heap.top2_set
 
         return min_heap, rmsup
 
     def build_promissing_item_arrays(self, min_heap: MinHeapTopK, all_items, con_map: dict, rmsup: int):
         '''
-        Build promising items arrays with refinement.
+        Build promising items arrays.
 
-        Step 1: Add items from min_heap (1-itemset and 2-itemset)
-        Step 2: Refine: Keep only items with sufficient support
+        Single pass over the heap snapshot: each 1-itemset contributes its
+        own item, each 2-itemset contributes the larger item to the smaller
+        item's partition. Arrays are canonicalized (sorted, deduplicated)
+        once at the end instead of in a separate refinement pass, so the
+        whole step is O(k) in the heap size rather than quadratic in the
+        item universe.
 
         output:  {item: [promising_items], ...}
         '''
-        promising_items_arr = {}
-
-        for item in all_items:
-            promising_items_arr[item] = []
-
-        # Step 1: Add items from min_heap
-        for support, itemset in min_heap.get_all():
+        # Reuse the snapshot taken in initialize_mh_and_rmsup when it came
+        # from this heap; otherwise (standalone call) walk the heap here.
+        if self._heap_snapshot is not None and self._heap_snapshot[0] is min_heap:
+            snapshot = self._heap_snapshot[1]
+            self._heap_snapshot = None
+        else:
+            snapshot = min_heap.get_all()
+
+        # Collect hits in a defaultdict so lists are only allocated for
+        # partitions the heap actually touches (at most top_k of them,
+        # typically far fewer than |all_items|)
+        hits = defaultdict(list)
+        for support, itemset in snapshot:
             if len(itemset) == 1:
                 x_i = itemset[0]
-                promising_items_arr[x_i].append(x_i)
+                hits[x_i].append(x_i)
 
             elif len(itemset) == 2:
                 # Ensure x_i < x_j for consistent partition assignment
-                items = sorted(itemset)
-                x_i, x_j = items[0], items[1]
-                promising_items_arr[x_i].append(x_j)
-
-        # Step 2: Refine AR_i based on rmsup and con_map
-        for x_i in all_items:
-            new_arr = []
-            for y in promising_items_arr[x_i]:
-                # Get support for item y in partition P_{x_i}
-                if y == x_i:
-                    # Check support of 1-itemset {x_i}
-                    sup = con_map.get(frozenset([x_i]), 0)
+                if itemset[0] < itemset[1]:
+                    x_i, x_j = itemset[0], itemset[1]
                 else:
-                    # Check support of 2-itemset {x_i, y}
-                    sup = con_map.get(frozenset([x_i, y]), 0)
-
-                # Keep item only if support >= rmsup
-                # if sup >= rmsup:
-                new_arr.append(y)
-
-            promising_items_arr[x_i] = sorted(set(new_arr))
+                    x_i, x_j = itemset[1], itemset[0]
+                hits[x_i].append(x_j)
+
+        # Finalize into a strict dict keyed by every item (callers index
+        # AR_i by partition), canonicalizing only the hit arrays. The
+        # rmsup/con_map support refinement (paper Step 2) is currently
+        # disabled, so no per-member con_map probe is needed here;
+        # filter_partitions applies the support pruning against rmsup.
+        promising_items_arr = {item: [] for item in all_items}
+        for x_i, members in hits.items():
+            if len(members) > 1:
+                members = sorted(set(members))
+            promising_items_arr[x_i] = members
 
         return promising_items_arr
 
@@ -104,19 +126,16 @@ class PrefixPartitioningbasedTopKAlgorithm:
             Tuple (min_heap, rmsup): Updated heap and minimum support threshold
         '''
         for partition in partitions:
-            # Promising items in current partition
-            for promissing_item in promissing_arr[partition]:
-                partition_support = con_map.get((partition,), 0)
-                if promissing_item == partition and partition_support <= rmsup:
-                    # TODO: Tai sao khogn remove buoc nay.
-                    # promissing_arr[partition] = []
-                    break
-
-                if promissing_item > partition:
-                    pair_key = (partition, promissing_item)
-                    pair_support = con_map.get(pair_key, 0)
-                    if pair_support <= rmsup:
-                        promissing_arr[partition].remove(promissing_item)
+            # Most partitions have an empty AR_i (the heap seeds at most
+            # top_k of them) - skip those before paying for the pruning
+            # scan. Non-empty short lists still go through the scan, as
+            # pair pruning applies to them too.
+            if not promissing_arr[partition]:
+                continue
+
+            # Prune unpromising items from AR_i (Algorithm 1, lines 12-19)
+            promissing_arr[partition] = self._prune_promising_items(
+                partition, promissing_arr[partition], con_map, rmsup)
 
             # Skip partition if promising items <= 2
             if len(promissing_arr[partition]) <= 2:
@@ -126,47 +145,92 @@ class PrefixPartitioningbasedTopKAlgorithm:
             if partitioner and hasattr(partitioner, 'prefix_partitions'):
                 partition_data = partitioner.prefix_partitions.get(
                     partition, [])
+                min_heap, rmsup = self._dispatch_partition(
+                    partition, promissing_arr[partition], partition_data,
+                    min_heap, rmsup)
 
-                # Process the partition using selected processor
-                # (vertical representation built inside execute)
-                if self.partition_processor == SglPartitionHybridCandidatePruning:
-                    # Use candidate pruning version that tracks top2_set
-                    min_heap, rmsup, self.top2_set = self.partition_processor.execute(
-                        partition_item=partition,
-                        promising_items=promissing_arr[partition],
-                        partition_data=partition_data,
-                        min_heap=min_heap,
-                        rmsup=rmsup,
-                        top2_set=self.top2_set
-                    )
-                else:
-                    # Use standard processor
-                    min_heap, rmsup = self.partition_processor.execute(
-                        partition_item=partition,
-                        promising_items=promissing_arr[partition],
-                        partition_data=partition_data,
-                        min_heap=min_heap,
-                        rmsup=rmsup
-                    )
+        return min_heap, rmsup
+
+    def _sequential_prune(self, promissing_arr: dict, partitions: List[int], con_map: dict, rmsup: int):
+        '''
+        Prune every partition's AR_i in place against a fixed rmsup.
+
+        Used by the parallel variants, which prune everything up front
+        (against the rmsup snapshot taken before dispatch) and then hand
+        the surviving partitions to their execution backend. The
+        sequential filter_partitions keeps its own interleaved loop so
+        later partitions are pruned with the rmsup raised by earlier ones.
+        '''
+        for partition in partitions:
+            if not promissing_arr[partition]:
+                continue
+            promissing_arr[partition] = self._prune_promising_items(
+                partition, promissing_arr[partition], con_map, rmsup)
+
+    def _dispatch_partition(self, partition: int, promising_items: List[int], partition_data: list, min_heap: MinHeapTopK, rmsup: int):
+        '''
+        Run the configured partition processor on one partition.
+
+        Single place that knows about the candidate-pruning variant's
+        extra top2_set in/out parameter; the vertical representation is
+        built inside execute.
+        '''
+        if self.partition_processor == SglPartitionHybridCandidatePruning:
+            min_heap, rmsup, self.top2_set = self.partition_processor.execute(
+                partition_item=partition,
+                promising_items=promising_items,
+                partition_data=partition_data,
+                min_heap=min_heap,
+                rmsup=rmsup,
+                top2_set=self.top2_set
+            )
+        else:
+            min_heap, rmsup = self.partition_processor.execute(
+                partition_item=partition,
+                promising_items=promising_items,
+                partition_data=partition_data,
+                min_heap=min_heap,
+                rmsup=rmsup
+            )
 
         return min_heap, rmsup
 
     @staticmethod
-    def _extract_top2_itemsets(min_heap: MinHeapTopK) -> Set[frozenset]:
-        """
-        Extract all 2-itemsets from min_heap into a set for O(1) lookup.
+    def _prune_promising_items(partition: int, promising_items: List[int], con_map: dict, rmsup: int) -> List[int]:
+        '''
+        Prune one partition's AR_i against rmsup.
 
-        Args:
-            min_heap: MinHeapTopK containing top-k itemsets
+        Kept as a self-contained kernel over plain ints/lists/dicts so the
+        hot scan is separate from the dispatch logic in filter_partitions,
+        and could be batched over partitions (or offloaded) without
+        touching the dispatch code.
 
-        Returns:
-            Set of frozenset({a, b}) for all 2-itemsets in min_heap
-        """
-        top2_set = set()
-
-        for support, itemset in min_heap.get_all():
-            if len(itemset) == 2:
-                pair = frozenset(itemset)
-                top2_set.add(pair)
+        Single pass building a kept list: list.remove while iterating the
+        same list was O(n) per removal and skipped the element after each
+        removed one. AR_i is sorted, so nothing can be removed before the
+        partition item itself is reached; breaking there with the list
+        unchanged matches the old behaviour.
 
-        return top2_set
+        Returns the pruned promising-items list.
+        '''
+        # Loop invariants: the partition's own support only depends on
+        # partition, and binding the bound method skips one attribute
+        # lookup per probe in the hot loop.
+        con_map_get = con_map.get
+        partition_support = con_map_get((partition,), 0)
+
+        kept = []
+        for promissing_item in promising_items:
+            if promissing_item == partition and partition_support <= rmsup:
+                # TODO: Tai sao khogn remove buoc nay.
+                # kept = []
+                return promising_items
+
+            if promissing_item > partition:
+                pair_support = con_map_get((partition, promissing_item), 0)
+                if pair_support <= rmsup:
+                    continue
+
+            kept.append(promissing_item)
+
+        return kept
@@ -83,19 +83,9 @@ class PrefixPartitioningbasedTopKAlgorithmMultiprocessing(PrefixPartitioningbase
         Returns:
             Tuple of (updated_min_heap, updated_rmsup)
         """
-        # Step 1: SEQUENTIAL pruning (Algorithm 1, lines 12-19)
-        for partition in partitions:
-            # Remove unpromising items from AR_i
-            for promissing_item in promissing_arr[partition]:
-                partition_support = con_map.get((partition,), 0)
-                if promissing_item == partition and partition_support <= rmsup:
-                    break
-                
-                if promissing_item > partition:
-                    pair_key = (partition, promissing_item)
-                    pair_support = con_map.get(pair_key, 0)
-                    if pair_support <= rmsup:
-                        promissing_arr[partition].remove(promissing_item)
+        # Step 1: SEQUENTIAL pruning (Algorithm 1, lines 12-19), shared
+        # with the other variants via the base class
+        self._sequential_prune(promissing_arr, partitions, con_map, rmsup)
         
         # Step 2: PARALLEL partition processing with multiprocessing
         if partitioner and hasattr(partitioner, 'prefix_partitions'):
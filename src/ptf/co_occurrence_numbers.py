@@ -5,6 +5,8 @@
 - sorted in the descending order of count. (Khong phai support)
 '''
 
+from collections import Counter
+from operator import itemgetter
 from typing import Dict, Tuple
 from ptf.prefix_partitioning import PrefixPartitioning
 from ptf.transaction_db import TransactionDB
@@ -25,26 +27,27 @@ class CoOccurrenceNumbers:
         '''
         Input: prefix partitions { prefix: [ [suffix1], [suffix2], ...], ...}
         Output: { prefix: {item: count, ...}, ...
+
+        Counting is one C-level Counter.update per transaction; the scan
+        over transactions is the only Python-level loop left here.
         '''
         partition_con_dict = {}
-        START_SUBFIX_INDEX = 1
 
         for prefix, partition in self.prefix_partition.prefix_partitions.items():
-            con_i = {}
+            # NOTE:
+            # Do bên prefix partitioning tác giả return [prefix, subfix1, subfix2, ...
+            # nen dem ca transaction la dem prefix (index 0) + cac subfix luon.
+            # Counter.update chay o tang C thay vi hai thao tac dict
+            # bytecode cho moi item.
+            con_i = Counter()
             for transaction in partition:
-                if not transaction:
-                    continue
-                # NOTE:
-                # Do bên prefix partitioning tác giả return [prefix, subfix1, subfix2, ...
-                # Mên cho nay dem phai: get index 0 la prefix, con lai la subfix
-                prefix = transaction[0]
-                con_i[prefix] = con_i.get(prefix, 0) + START_SUBFIX_INDEX
-
-                for j in range(1, len(transaction)):
-                    subfix = transaction[j]
-                    con_i[subfix] = con_i.get(subfix, 0) + START_SUBFIX_INDEX
+                if transaction:
+                    con_i.update(transaction)
+                    # Giu nguyen hanh vi goc: key cua partition la
+                    # transaction[0], khong phai key cua vong lap
+                    prefix = transaction[0]
 
-            partition_con_dict[prefix] = con_i
+            partition_con_dict[prefix] = dict(con_i)
 
         return partition_con_dict
 
@@ -54,43 +57,50 @@ class CoOccurrenceNumbers:
         output: [ prefix: [(itemset, count), ...]]}
         '''
 
-        CoN: Dict[int, Tuple[int, int]] = {}
-
-        for prefix, con_i in partition_con_dict.items():
-            for item, count in con_i.items():
-                if item == prefix:
-                    itemset = set([prefix])
-                else:
-                    itemset = set([prefix, item])
-
-                if prefix not in CoN:
-                    CoN[prefix] = []
-                CoN[prefix].append((itemset, count))
-
-        # Orderrihg each items in descending order of count
-        # x[1] la count
-        for prefix, con_list in CoN.items():
-            con_list.sort(key=lambda x: x[1], reverse=True)
-            CoN[prefix] = con_list
+        # Prefix khong co item nao thi khong vao CoN (giu hanh vi cu)
+        CoN: Dict[int, Tuple[int, int]] = {
+            prefix: [] for prefix, con_i in partition_con_dict.items() if con_i}
+
+        # Itemset la tuple canonical (sap xep san) thay vi set: khong
+        # cap phat PySet cho moi entry, va _build_con_map dung truc tiep
+        # lam key khong can sort lai. Flatten het cac partition roi sort
+        # MOT lan theo count giam dan: thay vi sort tung con_list roi
+        # sort lai full list, mot stable sort toan cuc cho ca hai - moi
+        # CoN[prefix] nhan entry theo dung thu tu giam dan khi duyet lai.
+        flat = [
+            (count, prefix,
+             (prefix,) if item == prefix
+             else ((prefix, item) if prefix < item else (item, prefix)))
+            for prefix, con_i in partition_con_dict.items() if con_i
+            for item, count in con_i.items()
+        ]
+        # itemgetter(0) (count) chay o tang C, khong goi lambda
+        # Python cho moi lan so sanh
+        flat.sort(key=itemgetter(0), reverse=True)
 
         full_con_list = []
-        for prefix, con_list in CoN.items():
-            full_con_list.extend(con_list)
-        full_con_list.sort(key=lambda x: x[1], reverse=True)
+        for count, prefix, itemset in flat:
+            entry = (itemset, count)
+            full_con_list.append(entry)
+            CoN[prefix].append(entry)
+
         return CoN, full_con_list
 
     def _build_con_map(self):
         '''
-        Build a fast lookup map: frozenset(itemset) -> support
-        Used in filter_partitions for O(1) 2-itemset support lookup
+        Build a fast lookup map: sorted tuple(itemset) -> support
+        Used in filter_partitions for O(1) 1-/2-itemset support lookup.
+
+        Tuple keys thay vi frozenset: filter_partitions probe bang
+        (partition,) va (partition, item) nen key phai cung dang.
+        Itemset da la tuple canonical tu _merge_partition_con nen dung
+        truc tiep, khong sort lai.
 
         Returns:
-            Dict[frozenset, int]: Maps itemset frozensets to their support values
+            Dict[tuple, int]: Maps sorted itemset tuples to their support values
         '''
-        con_map = {}
-        for itemset, support in self.full_co_occurrence_list:
-            con_map[frozenset(itemset)] = support
-        return con_map
+        return {itemset: support
+                for itemset, support in self.full_co_occurrence_list}
 
     def to_string(self):
         result = ""
@@ -10,9 +10,16 @@ Cases:
 6. Dif-list ∩ Bit-vector → Bit-vector (clear bits in complement)
 """
 
+from bisect import bisect_left
 from typing import List, Tuple
 from .tid_set_entry import TidSetEntry
 
+# Per-bit masks precomputed once: _SET_MASKS[b] tests/sets bit b of a
+# byte, _CLEAR_MASKS[b] clears it. Saves a shift (and an invert) per tid
+# in the bit-addressed loops below.
+_SET_MASKS = tuple(1 << b for b in range(8))
+_CLEAR_MASKS = tuple(0xFF ^ (1 << b) for b in range(8))
+
 
 class HybridTidSetIntersection:
     """
@@ -37,139 +44,190 @@ class HybridTidSetIntersection:
             Tuple of (result_entry, support) where result_entry is a TidSetEntry
             with the intersection result, and support is the number of transactions.
         """
-        flag1 = entry1.flag
-        flag2 = entry2.flag
-        
-        # Determine which case based on flags
-        if flag1 == TidSetEntry.TID_LIST and flag2 == TidSetEntry.TID_LIST:
-            # Case 1: Tid-list ∩ Tid-list
-            result_tids = HybridTidSetIntersection.intersect_tidlist_tidlist(
-                entry1.data, entry2.data
-            )
-            support = len(result_tids)
-            return TidSetEntry._create_optimal_entry(
-                item=-1,  # Placeholder, will be set by caller
-                tids=result_tids,
-                ni=ni
-            ), support
-        
-        elif flag1 == TidSetEntry.DIF_LIST and flag2 == TidSetEntry.DIF_LIST:
-            # Case 2: Dif-list ∩ Dif-list
-            result_tids = HybridTidSetIntersection.intersect_diflist_diflist(
-                entry1.data, entry2.data, ni
-            )
-            support = len(result_tids)
-            return TidSetEntry._create_optimal_entry(
-                item=-1,
-                tids=result_tids,
-                ni=ni
-            ), support
-        
-        elif flag1 == TidSetEntry.BIT_VECTOR and flag2 == TidSetEntry.BIT_VECTOR:
-            # Case 3: Bit-vector ∩ Bit-vector
-            result_bv = HybridTidSetIntersection.intersect_bitvector_bitvector(
-                entry1.data, entry2.data
-            )
-            support = TidSetEntry._count_bits_in_bytes(result_bv)
-            return TidSetEntry._create_bitvector_entry(item=-1, bv=result_bv, ni=ni), support
-        
-        elif flag1 == TidSetEntry.TID_LIST and flag2 == TidSetEntry.DIF_LIST:
-            # Case 4: Tid-list ∩ Dif-list
-            result_tids = HybridTidSetIntersection.intersect_tidlist_diflist(
-                entry1.data, entry2.data
-            )
-            support = len(result_tids)
-            return TidSetEntry._create_optimal_entry(
-                item=-1,
-                tids=result_tids,
-                ni=ni
-            ), support
-        
-        elif flag1 == TidSetEntry.DIF_LIST and flag2 == TidSetEntry.TID_LIST:
-            # Case 4 (reversed): Dif-list ∩ Tid-list
-            result_tids = HybridTidSetIntersection.intersect_tidlist_diflist(
-                entry2.data, entry1.data
-            )
-            support = len(result_tids)
-            return TidSetEntry._create_optimal_entry(
-                item=-1,
-                tids=result_tids,
-                ni=ni
-            ), support
-        
-        elif flag1 == TidSetEntry.TID_LIST and flag2 == TidSetEntry.BIT_VECTOR:
-            # Case 5: Tid-list ∩ Bit-vector
-            result_tids = HybridTidSetIntersection.intersect_tidlist_bitvector(
-                entry1.data, entry2.data
-            )
-            support = len(result_tids)
-            return TidSetEntry._create_optimal_entry(
-                item=-1,
-                tids=result_tids,
-                ni=ni
-            ), support
-        
-        elif flag1 == TidSetEntry.BIT_VECTOR and flag2 == TidSetEntry.TID_LIST:
-            # Case 5 (reversed): Bit-vector ∩ Tid-list
-            result_tids = HybridTidSetIntersection.intersect_tidlist_bitvector(
-                entry2.data, entry1.data
-            )
-            support = len(result_tids)
-            return TidSetEntry._create_optimal_entry(
-                item=-1,
-                tids=result_tids,
-                ni=ni
-            ), support
-        
-        elif flag1 == TidSetEntry.DIF_LIST and flag2 == TidSetEntry.BIT_VECTOR:
-            # Case 6: Dif-list ∩ Bit-vector
-            result_bv = HybridTidSetIntersection.intersect_diflist_bitvector(
-                entry1.data, entry2.data, ni
-            )
-            support = TidSetEntry._count_bits_in_bytes(result_bv)
-            return TidSetEntry._create_bitvector_entry(item=-1, bv=result_bv, ni=ni), support
-        
-        elif flag1 == TidSetEntry.BIT_VECTOR and flag2 == TidSetEntry.DIF_LIST:
-            # Case 6 (reversed): Bit-vector ∩ Dif-list
-            result_bv = HybridTidSetIntersection.intersect_diflist_bitvector(
-                entry2.data, entry1.data, ni
-            )
-            support = TidSetEntry._count_bits_in_bytes(result_bv)
-            return TidSetEntry._create_bitvector_entry(item=-1, bv=result_bv, ni=ni), support
-        
-        else:
-            raise ValueError(f"Unknown format combination: {flag1}, {flag2}")
-    
+        # One dict probe on the (flag1, flag2) pair instead of walking an
+        # 8-arm elif ladder per call; the table lives at module scope
+        # below the class body
+        handler = _DISPATCH.get((entry1.flag, entry2.flag))
+        if handler is None:
+            raise ValueError(
+                f"Unknown format combination: {entry1.flag}, {entry2.flag}")
+        return handler(entry1, entry2, ni)
+
+    @staticmethod
+    def intersect_prefix_batch(
+        entry_xi: TidSetEntry,
+        entries: List[TidSetEntry],
+        ni: int
+    ) -> List[Tuple[TidSetEntry, int]]:
+        """
+        Intersect one fixed entry against many partner entries (Phase 1).
+
+        When entry_xi is a bit-vector, its buffer is parsed into a
+        big-int ONCE and reused for every bit-vector partner, so each
+        pair costs one from_bytes + AND + popcount instead of the two
+        from_bytes the per-pair handler pays; the big-int ops process
+        the whole buffer in C. Non-bit-vector partners (and mismatched
+        buffers) fall back to the normal dispatcher, so results and
+        errors are identical to calling intersect() per pair.
+
+        Args:
+            entry_xi: The fixed entry (the partition prefix in Phase 1)
+            entries: Partner entries, one per promising item
+            ni: Total number of transactions in partition
+
+        Returns:
+            List of (result_entry, support), one per partner entry
+        """
+        intersect = HybridTidSetIntersection.intersect
+        if entry_xi.flag != TidSetEntry.BIT_VECTOR:
+            return [intersect(entry_xi, entry, ni) for entry in entries]
+
+        BV1 = entry_xi.data
+        num_bytes = len(BV1)
+        xi_bits = int.from_bytes(BV1, "little")
+        bit_vector = TidSetEntry.BIT_VECTOR
+        create_bv_entry = TidSetEntry._create_bitvector_entry
+
+        results = []
+        for entry in entries:
+            if entry.flag == bit_vector and len(entry.data) == num_bytes:
+                anded = xi_bits & int.from_bytes(entry.data, "little")
+                support = anded.bit_count()
+                results.append((create_bv_entry(
+                    item=-1, bv=anded.to_bytes(num_bytes, "little"),
+                    ni=ni, support=support), support))
+            else:
+                results.append(intersect(entry_xi, entry, ni))
+        return results
+
+    # ========== Per-case handlers (dispatch table targets) ==========
+    @staticmethod
+    def _pack_tidlist_result(result_tids: List[int], ni: int) -> Tuple[TidSetEntry, int]:
+        """Wrap a tid-list intersection result in its optimal entry format."""
+        # item=-1: placeholder, will be set by caller
+        return TidSetEntry._create_optimal_entry(
+            item=-1, tids=result_tids, ni=ni), len(result_tids)
+
+    @staticmethod
+    def _handle_tidlist_tidlist(entry1, entry2, ni):
+        # Case 1: Tid-list ∩ Tid-list
+        return HybridTidSetIntersection._pack_tidlist_result(
+            HybridTidSetIntersection.intersect_tidlist_tidlist(
+                entry1.data, entry2.data), ni)
+
+    @staticmethod
+    def _handle_diflist_diflist(entry1, entry2, ni):
+        # Case 2: Dif-list ∩ Dif-list
+        return HybridTidSetIntersection._pack_tidlist_result(
+            HybridTidSetIntersection.intersect_diflist_diflist(
+                entry1.data, entry2.data, ni), ni)
+
+    @staticmethod
+    def _handle_bitvector_bitvector(entry1, entry2, ni):
+        # Case 3: Bit-vector ∩ Bit-vector. Fused AND + popcount: going
+        # through intersect_bitvector_bitvector would serialize the ANDed
+        # big-int to bytes only for _count_bits_in_bytes to parse the
+        # bytes straight back into a big-int; here both the buffer and
+        # the support come from one int.
+        BV1, BV2 = entry1.data, entry2.data
+        if len(BV1) != len(BV2):
+            raise ValueError(
+                f"Bit-vector size mismatch: {len(BV1)} vs {len(BV2)}")
+        anded = int.from_bytes(BV1, "little") & int.from_bytes(BV2, "little")
+        result_bv = anded.to_bytes(len(BV1), "little")
+        support = anded.bit_count()
+        return TidSetEntry._create_bitvector_entry(
+            item=-1, bv=result_bv, ni=ni, support=support), support
+
+    @staticmethod
+    def _handle_tidlist_diflist(entry1, entry2, ni):
+        # Case 4: Tid-list ∩ Dif-list
+        return HybridTidSetIntersection._pack_tidlist_result(
+            HybridTidSetIntersection.intersect_tidlist_diflist(
+                entry1.data, entry2.data), ni)
+
+    @staticmethod
+    def _handle_diflist_tidlist(entry1, entry2, ni):
+        # Case 4 (reversed): Dif-list ∩ Tid-list
+        return HybridTidSetIntersection._pack_tidlist_result(
+            HybridTidSetIntersection.intersect_tidlist_diflist(
+                entry2.data, entry1.data), ni)
+
+    @staticmethod
+    def _handle_tidlist_bitvector(entry1, entry2, ni):
+        # Case 5: Tid-list ∩ Bit-vector
+        return HybridTidSetIntersection._pack_tidlist_result(
+            HybridTidSetIntersection.intersect_tidlist_bitvector(
+                entry1.data, entry2.data), ni)
+
+    @staticmethod
+    def _handle_bitvector_tidlist(entry1, entry2, ni):
+        # Case 5 (reversed): Bit-vector ∩ Tid-list
+        return HybridTidSetIntersection._pack_tidlist_result(
+            HybridTidSetIntersection.intersect_tidlist_bitvector(
+                entry2.data, entry1.data), ni)
+
+    @staticmethod
+    def _handle_diflist_bitvector(entry1, entry2, ni):
+        # Case 6: Dif-list ∩ Bit-vector
+        result_bv = HybridTidSetIntersection.intersect_diflist_bitvector(
+            entry1.data, entry2.data, ni)
+        support = TidSetEntry._count_bits_in_bytes(result_bv)
+        return TidSetEntry._create_bitvector_entry(
+            item=-1, bv=result_bv, ni=ni, support=support), support
+
+    @staticmethod
+    def _handle_bitvector_diflist(entry1, entry2, ni):
+        # Case 6 (reversed): Bit-vector ∩ Dif-list
+        result_bv = HybridTidSetIntersection.intersect_diflist_bitvector(
+            entry2.data, entry1.data, ni)
+        support = TidSetEntry._count_bits_in_bytes(result_bv)
+        return TidSetEntry._create_bitvector_entry(
+            item=-1, bv=result_bv, ni=ni, support=support), support
+
     # ========== Case 1: Tid-list ∩ Tid-list ==========
     @staticmethod
     def intersect_tidlist_tidlist(L1: List[int], L2: List[int]) -> List[int]:
         """
-        Intersect two tid-lists using two-pointer merge.
-        
-        Both lists must be sorted in ascending order.
-        Time complexity: O(|L1| + |L2|)
-        
+        Intersect two tid-lists via C-level set operations.
+
+        Both lists must be sorted in ascending order. Same rationale as
+        SglPartition._tidset_intersection: the bytecode two-pointer merge
+        paid an interpreter step per boxed-int comparison, while building
+        a set from the smaller list and probing it with the larger runs
+        entirely in C. Output stays a sorted list.
+
+        Time complexity: O(|L1| + |L2|) plus an O(r log r) result sort.
+
         Args:
             L1: Sorted tid-list 1
             L2: Sorted tid-list 2
-        
+
         Returns:
             Sorted intersection of L1 and L2
         """
-        result = []
-        i, j = 0, 0
-        
-        while i < len(L1) and j < len(L2):
-            if L1[i] == L2[j]:
-                result.append(L1[i])
-                i += 1
-                j += 1
-            elif L1[i] < L2[j]:
-                i += 1
-            else:
-                j += 1
-        
-        return result
+        if len(L1) > len(L2):
+            L1, L2 = L2, L1
+
+        # Heavily skewed sizes (rare item vs common item): binary-search
+        # the big list for each tid of the small one, O(|L1| log |L2|),
+        # instead of touching every element of the big list. bisect_left
+        # runs in C, and the lo bound advances monotonically because L1
+        # is sorted.
+        if len(L2) > 8 * len(L1):
+            result = []
+            big_len = len(L2)
+            pos = 0
+            for tid in L1:
+                pos = bisect_left(L2, tid, pos)
+                if pos == big_len:
+                    break
+                if L2[pos] == tid:
+                    result.append(tid)
+                    pos += 1
+            return result
+
+        return sorted(set(L1).intersection(L2))
     
     # ========== Case 2: Dif-list ∩ Dif-list ==========
     @staticmethod
@@ -190,11 +248,21 @@ class HybridTidSetIntersection:
         """
         # Compute D1 ∪ D2 (union of exclusions)
         d_union = HybridTidSetIntersection._union_sorted_lists(D1, D2)
-        
-        # Compute complement: L = {1..ni} \ (D1 ∪ D2)
-        d_union_set = set(d_union)
-        result = [tid for tid in range(ni) if tid not in d_union_set]
-        
+
+        # Compute complement: L = {1..ni} \ (D1 ∪ D2).
+        # d_union is sorted, so the complement is just the gaps between
+        # consecutive excluded tids - emit each gap with one C-level
+        # extend instead of hash-probing all ni tids. O(|D1|+|D2|+|L|)
+        # instead of O(ni) probes plus a throwaway set.
+        result = []
+        prev = 0
+        for d in d_union:
+            if d >= ni:
+                break
+            result.extend(range(prev, d))
+            prev = d + 1
+        result.extend(range(prev, ni))
+
         return result
     
     # ========== Case 3: Bit-vector ∩ Bit-vector ==========
@@ -205,22 +273,24 @@ class HybridTidSetIntersection:
         
         Bit i = 1 in result iff bit i = 1 in both BV1 and BV2.
         Time complexity: O(bytes)
-        
+
+        The AND runs on CPython big-ints instead of a per-byte Python
+        loop: int.from_bytes / & / to_bytes each process the whole
+        buffer in C, 30-bit limbs at a time (same trick as
+        TidSetEntry._count_bits_in_bytes).
+
         Args:
             BV1: Bit-vector 1
             BV2: Bit-vector 2 (same size)
-        
+
         Returns:
             Bit-vector result of BV1 & BV2
         """
         if len(BV1) != len(BV2):
             raise ValueError(f"Bit-vector size mismatch: {len(BV1)} vs {len(BV2)}")
-        
-        result = bytearray(len(BV1))
-        for i in range(len(BV1)):
-            result[i] = BV1[i] & BV2[i]
-        
-        return bytes(result)
+
+        anded = int.from_bytes(BV1, "little") & int.from_bytes(BV2, "little")
+        return anded.to_bytes(len(BV1), "little")
     
     # ========== Case 4: Tid-list ∩ Dif-list ==========
     @staticmethod
@@ -276,16 +346,12 @@ class HybridTidSetIntersection:
         Returns:
             Sorted tid-list of intersection
         """
-        result = []
-        for tid in L:
-            byte_idx = tid // 8
-            bit_idx = tid % 8
-            
-            if byte_idx < len(BV):
-                if BV[byte_idx] & (1 << bit_idx):
-                    result.append(tid)
-        
-        return result
+        # Single comprehension with the shared bit-mask table: no
+        # per-tid mask shift, no len(BV) re-measure, no append dispatch
+        num_bytes = len(BV)
+        set_masks = _SET_MASKS
+        return [tid for tid in L
+                if (tid >> 3) < num_bytes and BV[tid >> 3] & set_masks[tid & 7]]
     
     # ========== Case 6: Dif-list ∩ Bit-vector ==========
     @staticmethod
@@ -307,15 +373,15 @@ class HybridTidSetIntersection:
             Bit-vector result (BV with D tids cleared)
         """
         result = bytearray(BV)
-        
+        num_bytes = len(result)
+        clear_masks = _CLEAR_MASKS
+
         for tid in D:
-            byte_idx = tid // 8
-            bit_idx = tid % 8
-            
-            if byte_idx < len(result):
-                # Clear the bit
-                result[byte_idx] &= ~(1 << bit_idx)
-        
+            byte_idx = tid >> 3
+            if byte_idx < num_bytes:
+                # Clear the bit (mask precomputed per bit position)
+                result[byte_idx] &= clear_masks[tid & 7]
+
         return bytes(result)
     
     # ========== Helper methods ==========
@@ -323,31 +389,42 @@ class HybridTidSetIntersection:
     def _union_sorted_lists(L1: List[int], L2: List[int]) -> List[int]:
         """
         Compute union of two sorted lists.
-        
+
+        C-level set union plus one sort, same reasoning as the
+        intersection kernels: the bytecode two-pointer walk paid an
+        interpreter step per element, set.union and sorted run in C.
+        Duplicates across the inputs collapse, as before.
+
         Args:
             L1: Sorted list 1
             L2: Sorted list 2
-        
+
         Returns:
             Sorted union of L1 and L2
         """
-        result = []
-        i, j = 0, 0
-        
-        while i < len(L1) and j < len(L2):
-            if L1[i] == L2[j]:
-                result.append(L1[i])
-                i += 1
-                j += 1
-            elif L1[i] < L2[j]:
-                result.append(L1[i])
-                i += 1
-            else:
-                result.append(L2[j])
-                j += 1
-        
-        # Add remaining elements
-        result.extend(L1[i:])
-        result.extend(L2[j:])
-        
-        return result
+        return sorted(set(L1).union(L2))
+
+
+# (flag1, flag2) -> handler. Built once after the class body so the
+# handlers are plain functions by the time they are stored (no
+# staticmethod descriptor indirection on the call path).
+_DISPATCH = {
+    (TidSetEntry.TID_LIST, TidSetEntry.TID_LIST):
+        HybridTidSetIntersection._handle_tidlist_tidlist,
+    (TidSetEntry.DIF_LIST, TidSetEntry.DIF_LIST):
+        HybridTidSetIntersection._handle_diflist_diflist,
+    (TidSetEntry.BIT_VECTOR, TidSetEntry.BIT_VECTOR):
+        HybridTidSetIntersection._handle_bitvector_bitvector,
+    (TidSetEntry.TID_LIST, TidSetEntry.DIF_LIST):
+        HybridTidSetIntersection._handle_tidlist_diflist,
+    (TidSetEntry.DIF_LIST, TidSetEntry.TID_LIST):
+        HybridTidSetIntersection._handle_diflist_tidlist,
+    (TidSetEntry.TID_LIST, TidSetEntry.BIT_VECTOR):
+        HybridTidSetIntersection._handle_tidlist_bitvector,
+    (TidSetEntry.BIT_VECTOR, TidSetEntry.TID_LIST):
+        HybridTidSetIntersection._handle_bitvector_tidlist,
+    (TidSetEntry.DIF_LIST, TidSetEntry.BIT_VECTOR):
+        HybridTidSetIntersection._handle_diflist_bitvector,
+    (TidSetEntry.BIT_VECTOR, TidSetEntry.DIF_LIST):
+        HybridTidSetIntersection._handle_bitvector_diflist,
+}
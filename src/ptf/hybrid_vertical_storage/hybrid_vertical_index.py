@@ -55,28 +55,29 @@ class HybridVerticalIndex:
             partition_data: Transactions in partition (List[List[int]])
             promising_items: Promising items for this partition (includes partition_item)
         """
-        # Step 1: Collect tid-sets for all items
-        tidsets: Dict[int, List[int]] = {}
-        
-        # Initialize empty tid-sets for all promising items except partition_item
-        for item in promising_items:
-            if item != self.partition_item:
-                tidsets[item] = []
-        
-        # Prefix item appears in all transactions
-        tidsets[self.partition_item] = list(range(self.ni))
-        
-        # Step 2: Assign local TID and build tid-sets
+        # Step 1: Collect tid-sets for the suffix items only. The prefix
+        # appears in every transaction (its tid-set is a range), and
+        # keeping it out of the probe dict removes the per-item prefix
+        # comparison from the scan - same scan shape as
+        # SglPartition.build_vertical_representation.
+        tidsets: Dict[int, List[int]] = {
+            item: [] for item in promising_items if item != self.partition_item}
+
+        # Step 2: Assign local TID and build tid-sets. dict.get resolves
+        # membership and lookup in one hash probe per item; local_tid is
+        # appended in increasing enumeration order, so the tid-sets come
+        # out sorted without a separate sort pass.
+        tidsets_get = tidsets.get
         for local_tid, transaction in enumerate(partition_data):
             for item in transaction:
-                if item in tidsets and item != self.partition_item:
-                    tidsets[item].append(local_tid)
-        
-        # Step 3: Sort tid-sets for efficient operations
-        for item in tidsets:
-            tidsets[item].sort()
-        
-        # Step 4: Create TidSetEntry with optimal format for each item
+                tidset = tidsets_get(item)
+                if tidset is not None:
+                    tidset.append(local_tid)
+
+        # Prefix item appears in all transactions
+        tidsets[self.partition_item] = list(range(self.ni))
+
+        # Step 3: Create TidSetEntry with optimal format for each item
         for item, tids in tidsets.items():
             entry = TidSetEntry._create_optimal_entry(
                 item=item,
@@ -18,6 +18,8 @@ Both techniques guarantee:
 """
 
 import heapq
+from bisect import bisect_right
+from itertools import count
 from typing import List, Dict, Tuple, Set
 from ptf.min_heap import MinHeapTopK
 from ptf.hybrid_vertical_storage import (
@@ -154,132 +156,168 @@ class SglPartitionHybridCandidatePruning:
         This is the main algorithm combining hybrid tid-set storage with two pruning techniques:
         1. Timeliness Pruning: Check support(X∪{y2}) <= rmsup before intersection
         2. Last-item Pruning: Check if {y1, y2} is in top-k 2-itemsets before intersection
+
+        Itemsets are int bitmasks over AR_i positions (bit 0 = prefix,
+        bit j = promising_items[j]), like SglPartitionHybrid: itemset
+        hashing/diffing/extension are integer ops, and the last item's
+        position is mask.bit_length() - 1. top2_set keeps its external
+        frozenset representation (it travels between partitions through
+        the algorithm object).
         """
-        
+        n = len(promising_items)
+        if n == 0:
+            return min_heap, rmsup, top2_set
+
+        # bit position -> item (bit 0 is always the prefix)
+        pos_items = [partition_item] + list(promising_items[1:])
+
         # PHASE 1: Initialize 2-itemsets
         # ============================================================
-        # HT: Hash table mapping frozenset(itemset) -> HTEntry with support info
-        ht = {}  # frozenset(itemset) -> {'entry': TidSetEntry, 'support': int}
-        qe = []  # Priority queue (max-heap): [(-support, itemset), ...]
-        
+        ht = {}  # itemset bitmask -> (TidSetEntry, support)
+        qe = []  # Priority queue (max-heap): [(-support, tie, bitmask), ...]
+
+        # Tie-breaker for equal supports: a fresh counter value per push
+        # means heap comparisons never fall through to the bitmask;
+        # ties pop in insertion order.
+        tie = count()
+        tie_next = tie.__next__
+
+        # AR_i positions whose Phase-1 pair survived, in ascending
+        # order. Every itemset that ever enters HT is built from these
+        # pairs, so Phase 2 only needs to try extension items from this
+        # list - dead positions would just miss the HT probe.
+        survivors = []
+
+        intersect = HybridTidSetIntersection.intersect
+
         # Create initial 2-itemsets from promising items
-        # For each pair (xi, xj) where xi is prefix and xj in AR_i
-        for j in range(1, len(promising_items)):
-            xj = promising_items[j]
-            
-            # Get tid-set entries from vertical index
-            if not vertical_index.contains_item(partition_item) or not vertical_index.contains_item(xj):
-                continue
-            
+        # For each pair (xi, xj) where xi is prefix and xj in AR_i.
+        # All pairs share entry_xi, so the batch kernel parses its
+        # bit-vector into a big-int once instead of once per pair.
+        if (vertical_index.contains_item(partition_item)
+                and vertical_index.get_entry(partition_item).get_support() > rmsup):
             entry_xi = vertical_index.get_entry(partition_item)
-            entry_xj = vertical_index.get_entry(xj)
-            
-            # Calculate tid-set intersection using hybrid dispatcher
-            entry_pair, support_pair = HybridTidSetIntersection.intersect(
-                entry_xi, entry_xj, partition_size)
-            
-            if support_pair > rmsup:
-                # Create itemset key (frozenset for hashing)
-                itemset_key = frozenset([partition_item, xj])
-                
-                # Store both TidSetEntry and support in HT
-                ht[itemset_key] = {
-                    'entry': entry_pair,
-                    'support': support_pair
-                }
-                
-                # Add to priority queue (use negative support for max-heap)
-                heapq.heappush(qe, (-support_pair, itemset_key))
-        
+            positions = []
+            entries = []
+            for j in range(1, n):
+                xj = promising_items[j]
+                if not vertical_index.contains_item(xj):
+                    continue
+                entry_xj = vertical_index.get_entry(xj)
+                # A pair's support cannot exceed either item's own
+                # support (cached at build time), so this O(1) check
+                # skips the whole intersection for unviable items
+                if entry_xj.get_support() <= rmsup:
+                    continue
+                positions.append(j)
+                entries.append(entry_xj)
+            results = HybridTidSetIntersection.intersect_prefix_batch(
+                entry_xi, entries, partition_size)
+
+            # Uniform all-bit-vector partition: every intersection in
+            # Phase 2 is (BV, BV) producing another BV, so bind the
+            # monomorphic handler and skip the per-pair dispatch probe.
+            # Bit-vector is the only format closed under intersection;
+            # tid-list results may be re-encoded by _create_optimal_entry,
+            # so mixed and all-tid-list partitions keep the dispatcher.
+            bit_vector = TidSetEntry.BIT_VECTOR
+            if entry_xi.flag == bit_vector and all(
+                    entry.flag == bit_vector for entry in entries):
+                intersect = HybridTidSetIntersection._handle_bitvector_bitvector
+
+            for j, (entry_pair, support_pair) in zip(positions, results):
+                if support_pair > rmsup:
+                    mask = 1 | (1 << j)
+                    # Store both TidSetEntry and support in HT
+                    ht[mask] = (entry_pair, support_pair)
+                    survivors.append(j)
+
+                    # Plain append; one heapify below builds the queue
+                    # in O(n) instead of n O(log n) pushes
+                    qe.append((-support_pair, tie_next(), mask))
+
+        heapq.heapify(qe)
+
         # PHASE 2: Main loop - Expand itemsets high-support-first
         # ============================================================
+        min_heap_insert = min_heap.insert
+        min_heap_min_support = min_heap.min_support
+        heappush = heapq.heappush
+        heappop = heapq.heappop
+        ht_get = ht.get
+
         while qe:
             # Step 2.1: Pop itemset with maximum support
-            neg_support_rt, itemset_rt = heapq.heappop(qe)
+            neg_support_rt, _, mask_rt = heappop(qe)
             support_rt = -neg_support_rt
-            
+
             # Step 2.2: Check termination condition
             # If max support in queue <= rmsup, no more itemsets can be top-k
             if support_rt <= rmsup:
                 break
-            
+
             # Step 2.3: Update MH if itemset size >= 3
             # Only 3+ itemsets are candidates for top-k
-            if len(itemset_rt) >= 3:
-                # Convert frozenset back to sorted tuple for heap
-                itemset_tuple = tuple(sorted(itemset_rt))
-                min_heap.insert(support=support_rt, itemset=itemset_tuple)
-                
+            if mask_rt.bit_count() >= 3:
+                # Materialize the bitmask as a sorted item tuple for the heap
+                itemset_tuple = tuple(sorted(
+                    pos_items[i] for i in range(n) if (mask_rt >> i) & 1))
+                min_heap_insert(support=support_rt, itemset=itemset_tuple)
+
                 # Update rmsup (minimum support in top-k)
                 old_rmsup = rmsup
-                rmsup = min_heap.min_support()
-                
+                rmsup = min_heap_min_support()
+
                 # If rmsup increased, update top2_set
+                # (maintained incrementally by MinHeapTopK, no heap walk)
                 if rmsup > old_rmsup:
-                    top2_set = SglPartitionHybridCandidatePruning._extract_top2_itemsets(min_heap)
-            
+                    top2_set = min_heap.top2_set
+
             # Step 2.4-2.9: Try extending itemset with remaining items
             # Only extend with items that come after last item in AR_i
-            itemset_list = sorted(list(itemset_rt))
-            last_item = itemset_list[-1]
-            y1 = last_item  # For last-item pruning
-            
-            try:
-                # Find position of last_item in promising_items
-                last_pos = promising_items.index(last_item)
-            except ValueError:
-                # last_item not in promising_items, skip
-                continue
-            
-            # Try extending with items after last_pos in promising_items
-            for next_pos in range(last_pos + 1, len(promising_items)):
-                y2 = promising_items[next_pos]
-                
+            last_pos = mask_rt.bit_length() - 1
+            mask_without_last = mask_rt ^ (1 << last_pos)
+            y1 = pos_items[last_pos]  # For last-item pruning
+
+            entry_rt = ht[mask_rt][0]
+
+            for next_pos in survivors[bisect_right(survivors, last_pos):]:
+                y2_bit = 1 << next_pos
+
                 # Step 2.5: Check if X ∪ {y2} exists in HT
                 # where X = itemset_rt \ {last_item}
-                itemset_without_last = frozenset(itemset_rt - {last_item})
-                itemset_with_y2 = itemset_without_last | {y2}
-                
-                # By Theorem 3: If itemset_with_y2 not in HT,
-                # then support(itemset_rt + {y2}) <= rmsup
-                if itemset_with_y2 not in ht:
+                # By Theorem 3: If it is absent,
+                # support(itemset_rt + {y2}) <= rmsup
+                slot_with_y2 = ht_get(mask_without_last | y2_bit)
+                if slot_with_y2 is None:
                     continue
-                
+
                 # ===== PRUNING 1: TIMELINESS PRUNING =====
                 # If support(X∪{y2}) <= rmsup, skip
                 # because support(X∪{y1,y2}) <= support(X∪{y2}) <= rmsup
-                ht_entry_with_y2 = ht[itemset_with_y2]
-                if ht_entry_with_y2['support'] <= rmsup:
+                entry_last_y2, support_with_y2 = slot_with_y2
+                if support_with_y2 <= rmsup:
                     continue
-                
+
                 # ===== PRUNING 2: LAST-ITEM PRUNING =====
                 # If {y1, y2} not in top-k 2-itemsets, skip
                 # because any superset containing {y1,y2} cannot be top-k
-                pair_key = frozenset([y1, y2])
+                pair_key = frozenset([y1, pos_items[next_pos]])
                 if pair_key not in top2_set:
                     continue
-                
+
                 # Step 2.6: Calculate tid-set intersection
-                entry_last_y2 = ht_entry_with_y2['entry']
-                entry_rt = ht[itemset_rt]['entry']
-                
-                if entry_rt is None or entry_last_y2 is None:
-                    continue
-                
-                # Use hybrid intersection dispatcher
-                entry_new, support_new = HybridTidSetIntersection.intersect(
+                # using the hybrid dispatcher
+                entry_new, support_new = intersect(
                     entry_rt, entry_last_y2, partition_size)
-                
+
                 # Step 2.7: Check support threshold
                 if support_new > rmsup:
                     # Step 2.8: Add new itemset to HT and QE
-                    itemset_new = itemset_rt | {y2}
-                    ht[itemset_new] = {
-                        'entry': entry_new,
-                        'support': support_new
-                    }
-                    heapq.heappush(qe, (-support_new, itemset_new))
-        
+                    mask_new = mask_rt | y2_bit
+                    ht[mask_new] = (entry_new, support_new)
+                    heappush(qe, (-support_new, tie_next(), mask_new))
+
         return min_heap, rmsup, top2_set
     
     @staticmethod
@@ -388,8 +426,9 @@ class SglPartitionHybridCandidatePruning:
                 old_rmsup = rmsup
                 rmsup = min_heap.min_support()
                 
+                # (maintained incrementally by MinHeapTopK, no heap walk)
                 if rmsup > old_rmsup:
-                    top2_set = SglPartitionHybridCandidatePruning._extract_top2_itemsets(min_heap)
+                    top2_set = min_heap.top2_set
             
             itemset_list = sorted(list(itemset_rt))
             last_item = itemset_list[-1]
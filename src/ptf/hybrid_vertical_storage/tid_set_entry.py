@@ -27,6 +27,11 @@ class TidSetEntry:
     TID_LIST = 1
     DIF_LIST = 0
     BIT_VECTOR = -1
+
+    # One entry exists per item per partition, so the per-instance
+    # __dict__ dominated the object's footprint; slots also make
+    # flag/data reads an offset load instead of a dict probe.
+    __slots__ = ('item', 'flag', 'data', 'size_bytes', 'ni', '_support')
     
     def __init__(
         self,
@@ -34,34 +39,48 @@ class TidSetEntry:
         flag: int,
         data: Union[List[int], bytes],
         size_bytes: int,
-        ni: int = 0
+        ni: int = 0,
+        support: int = None
     ):
         """
         Initialize a TidSetEntry.
-        
+
         Args:
             item: Item identifier
             flag: Format (TidSetEntry.TID_LIST, DIF_LIST, or BIT_VECTOR)
             data: Encoded tid-set (List[int] for lists, bytes for bit-vector)
             size_bytes: Size in bytes for memory tracking
             ni: Total transactions (required for dif-list/bit-vector support calculation)
+            support: Precomputed support, when the caller already knows it
+                     (e.g. right after an intersection); computed lazily otherwise
         """
         if flag not in (self.TID_LIST, self.DIF_LIST, self.BIT_VECTOR):
             raise ValueError(f"Invalid flag: {flag}. Must be {self.TID_LIST}, {self.DIF_LIST}, or {self.BIT_VECTOR}")
-        
+
         self.item = item
         self.flag = flag
         self.data = data
         self.size_bytes = size_bytes
         self.ni = ni
-    
+        self._support = support
+
     def get_support(self) -> int:
         """
         Get support (number of transactions containing item) without full decoding.
-        
+
+        Cached after the first computation (the bit-vector popcount
+        re-scans the whole buffer otherwise); entries are treated as
+        immutable once built.
+
         Returns:
             Support value for this tid-set
         """
+        if self._support is not None:
+            return self._support
+        self._support = self._compute_support()
+        return self._support
+
+    def _compute_support(self) -> int:
         if self.flag == self.TID_LIST:
             # Support = number of tids in the list
             return len(self.data) if isinstance(self.data, list) else 0
@@ -137,30 +156,13 @@ class TidSetEntry:
     @staticmethod
     def _count_bits_in_bytes(data: bytes) -> int:
         """
-        Count number of 1-bits in byte array using lookup table.
-        
-        More efficient than counting bit-by-bit.
+        Count number of 1-bits in byte array.
+
+        One big-int conversion plus int.bit_count() runs the whole
+        popcount in C, instead of a Python-level loop with a per-byte
+        lookup table.
         """
-        # Lookup table: number of 1-bits for each byte value 0-255
-        BIT_COUNT = [
-            0, 1, 1, 2, 1, 2, 2, 3, 1, 2, 2, 3, 2, 3, 3, 4,
-            1, 2, 2, 3, 2, 3, 3, 4, 2, 3, 3, 4, 3, 4, 4, 5,
-            1, 2, 2, 3, 2, 3, 3, 4, 2, 3, 3, 4, 3, 4, 4, 5,
-            2, 3, 3, 4, 3, 4, 4, 5, 3, 4, 4, 5, 4, 5, 5, 6,
-            1, 2, 2, 3, 2, 3, 3, 4, 2, 3, 3, 4, 3, 4, 4, 5,
-            2, 3, 3, 4, 3, 4, 4, 5, 3, 4, 4, 5, 4, 5, 5, 6,
-            2, 3, 3, 4, 3, 4, 4, 5, 3, 4, 4, 5, 4, 5, 5, 6,
-            3, 4, 4, 5, 4, 5, 5, 6, 4, 5, 5, 6, 5, 6, 6, 7,
-            1, 2, 2, 3, 2, 3, 3, 4, 2, 3, 3, 4, 3, 4, 4, 5,
-            2, 3, 3, 4, 3, 4, 4, 5, 3, 4, 4, 5, 4, 5, 5, 6,
-            2, 3, 3, 4, 3, 4, 4, 5, 3, 4, 4, 5, 4, 5, 5, 6,
-            3, 4, 4, 5, 4, 5, 5, 6, 4, 5, 5, 6, 5, 6, 6, 7,
-            2, 3, 3, 4, 3, 4, 4, 5, 3, 4, 4, 5, 4, 5, 5, 6,
-            3, 4, 4, 5, 4, 5, 5, 6, 4, 5, 5, 6, 5, 6, 6, 7,
-            3, 4, 4, 5, 4, 5, 5, 6, 4, 5, 5, 6, 5, 6, 6, 7,
-            4, 5, 5, 6, 5, 6, 6, 7, 5, 6, 6, 7, 6, 7, 7, 8,
-        ]
-        return sum(BIT_COUNT[byte_val] for byte_val in data)
+        return int.from_bytes(data, "little").bit_count()
     
     @staticmethod
     def _create_optimal_entry(item: int, tids: List[int], ni: int) -> 'TidSetEntry':
@@ -184,7 +186,8 @@ class TidSetEntry:
                 flag=TidSetEntry.TID_LIST,
                 data=tids,
                 size_bytes=sz_tid,
-                ni=ni
+                ni=ni,
+                support=L
             )
         elif sz_dif <= sz_tid and sz_dif <= sz_bv:
             # Dif-list is smallest
@@ -195,7 +198,8 @@ class TidSetEntry:
                 flag=TidSetEntry.DIF_LIST,
                 data=dif_list,
                 size_bytes=sz_dif,
-                ni=ni
+                ni=ni,
+                support=L
             )
         else:
             # Bit-vector is smallest
@@ -205,18 +209,20 @@ class TidSetEntry:
                 flag=TidSetEntry.BIT_VECTOR,
                 data=bv,
                 size_bytes=sz_bv,
-                ni=ni
+                ni=ni,
+                support=L
             )
-    
+
     @staticmethod
-    def _create_bitvector_entry(item: int, bv: bytes, ni: int) -> 'TidSetEntry':
-        """Create a bit-vector TidSetEntry."""
+    def _create_bitvector_entry(item: int, bv: bytes, ni: int, support: int = None) -> 'TidSetEntry':
+        """Create a bit-vector TidSetEntry (support passed when already counted)."""
         return TidSetEntry(
             item=item,
             flag=TidSetEntry.BIT_VECTOR,
             data=bv,
             size_bytes=len(bv),
-            ni=ni
+            ni=ni,
+            support=support
         )
     
     @staticmethod
@@ -1,5 +1,5 @@
 import heapq
-from typing import Dict, List, Tuple
+from typing import Dict, List, Set, Tuple
 '''
   min heap MH of size k (initially empty) to maintain the k most frequent itemsets discovered so far
 '''
@@ -8,8 +8,16 @@ from typing import Dict, List, Tuple
 class MinHeapTopK:
     def __init__(self, k: int):
         self.k = k
+        # Kept compact (no [None]*k preallocation): heapq and the
+        # len()-based size/invariant checks both assume every slot is a
+        # live entry. Bulk loads avoid incremental growth via from_items,
+        # which builds the backing list at its final size in one shot.
         self.heap: List[Tuple[int, Tuple]] = []  # (support, itemset)
         self.itemset_map: Dict[Tuple, int] = {}  # itemset -> support
+        # 2-itemsets currently in the heap, maintained on every
+        # insert/eviction so last-item pruning never has to rebuild it
+        # by walking the whole heap.
+        self.top2_set: Set[frozenset] = set()
 
     def insert(self, support: int, itemset: Tuple):
         """
@@ -32,13 +40,43 @@ class MinHeapTopK:
         if len(self.heap) < self.k:
             heapq.heappush(self.heap, (support, itemset))
             self.itemset_map[itemset] = support
+            if len(itemset) == 2:
+                self.top2_set.add(frozenset(itemset))
         elif support > self.heap[0][0]:
-            # Replace minimum element with new higher-support itemset
-            old_support, old_itemset = heapq.heappushpop(
+            # Replace minimum element with new higher-support itemset.
+            # heapreplace skips heappushpop's redundant root comparison -
+            # the elif above already established the new entry wins.
+            old_support, old_itemset = heapq.heapreplace(
                 self.heap, (support, itemset))
             if old_itemset in self.itemset_map:
                 del self.itemset_map[old_itemset]
             self.itemset_map[itemset] = support
+            if len(old_itemset) == 2:
+                self.top2_set.discard(frozenset(old_itemset))
+            if len(itemset) == 2:
+                self.top2_set.add(frozenset(itemset))
+
+    @classmethod
+    def from_items(cls, k: int, items: List[Tuple[int, Tuple]]) -> "MinHeapTopK":
+        """
+        Bulk-load up to the first k (support, itemset) pairs.
+
+        One O(n) heapify instead of k O(log k) sifting inserts.
+        Duplicate itemsets keep their highest support, matching the
+        semantics of repeated insert() calls on a non-full heap.
+        """
+        mh = cls(k)
+        itemset_map = mh.itemset_map
+        for support, itemset in items[:k]:
+            existing = itemset_map.get(itemset)
+            if existing is None or support > existing:
+                itemset_map[itemset] = support
+        mh.heap = [(support, itemset)
+                   for itemset, support in itemset_map.items()]
+        heapq.heapify(mh.heap)
+        mh.top2_set = {frozenset(itemset)
+                       for itemset in itemset_map if len(itemset) == 2}
+        return mh
 
     def min_support(self) -> int:
         """Get minimum support value in heap (smallest element)"""
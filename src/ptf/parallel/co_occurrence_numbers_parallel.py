@@ -82,10 +82,14 @@ class CoOccurrenceNumbersParallel:
 
         for prefix, con_i in partition_con_dict.items():
             for item, count in con_i.items():
+                # Tuple canonical thay vi set: khong cap phat PySet moi
+                # entry, _build_con_map dung truc tiep lam key
                 if item == prefix:
-                    itemset = set([prefix])
+                    itemset = (prefix,)
+                elif prefix < item:
+                    itemset = (prefix, item)
                 else:
-                    itemset = set([prefix, item])
+                    itemset = (item, prefix)
                 if prefix not in CoN:
                     CoN[prefix] = []
                 CoN[prefix].append((itemset, count))
@@ -103,10 +107,10 @@ class CoOccurrenceNumbersParallel:
         return CoN, full_con_list
 
     def _build_con_map(self):
-        con_map = {}
-        for itemset, support in self.full_co_occurrence_list:
-            con_map[frozenset(itemset)] = support
-        return con_map
+        # Sorted tuple keys de khop voi probe (partition,) / (partition, item)
+        # trong filter_partitions; itemset da canonical nen khong sort lai
+        return {itemset: support
+                for itemset, support in self.full_co_occurrence_list}
 
     def to_string(self):
         result = ""
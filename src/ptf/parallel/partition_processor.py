@@ -7,13 +7,15 @@ maintaining local copies of the min-heap. Results are merged after all
 partitions complete.
 
 Key Design:
-- Thread-safe by design (no shared mutable state during processing)
 - Local MH buffers avoid lock contention
+- The only shared state is a lock-guarded rmsup broadcast, read once at
+  worker start and published once at worker end
 - Merge phase combines results from all workers
 """
 
 import os
 import concurrent.futures
+import threading
 from typing import Tuple, List, Dict
 from ptf.min_heap import MinHeapTopK
 
@@ -49,6 +51,8 @@ class ParallelPartitionProcessor:
         self.thread_pool = concurrent.futures.ThreadPoolExecutor(
             max_workers=self.num_workers
         )
+        # Protects the shared rmsup broadcast between worker threads
+        self._rmsup_lock = threading.Lock()
     
     def process_partitions(
         self,
@@ -101,11 +105,26 @@ class ParallelPartitionProcessor:
                 'initial_rmsup': initial_rmsup
             }
             work_items.append(work_item)
-        
+
         if not work_items:
             # No partitions to process, return initial state
             return initial_min_heap, initial_rmsup
-        
+
+        # Largest-work-first (LPT) order: dispatch the most expensive
+        # partitions before the cheap tail so the biggest one does not end
+        # up running alone at the end. |transactions| x |AR_i| is a rough
+        # proxy for intersection cost.
+        work_items.sort(
+            key=lambda w: len(w['partition_data']) * len(w['promising_items']),
+            reverse=True)
+
+        # Shared rmsup broadcast: workers publish the best threshold they
+        # find, and workers that start later adopt it, pruning harder than
+        # the snapshot taken before submission would allow
+        shared_rmsup = {'value': initial_rmsup}
+        for work_item in work_items:
+            work_item['shared_rmsup'] = shared_rmsup
+
         # Step 2: Submit work items to thread pool
         futures = []
         for work_item in work_items:
@@ -153,6 +172,14 @@ class ParallelPartitionProcessor:
         Returns:
             Tuple of (updated_local_min_heap, updated_local_rmsup)
         """
+        # Adopt the best rmsup any finished worker has published so far;
+        # a higher threshold prunes more candidates in this partition
+        shared_rmsup = work_item.get('shared_rmsup')
+        start_rmsup = work_item['initial_rmsup']
+        if shared_rmsup is not None:
+            with self._rmsup_lock:
+                start_rmsup = max(start_rmsup, shared_rmsup['value'])
+
         # Execute partition processing using the partition processor class
         # (SglPartition, SglPartitionHybrid, or SglPartitionHybridCandidatePruning)
         result = self.partition_class.execute(
@@ -160,16 +187,22 @@ class ParallelPartitionProcessor:
             promising_items=work_item['promising_items'],
             partition_data=work_item['partition_data'],
             min_heap=work_item['initial_min_heap_copy'],
-            rmsup=work_item['initial_rmsup']
+            rmsup=start_rmsup
         )
-        
+
         # Handle both 2-tuple and 3-tuple returns
         # SglPartitionHybridCandidatePruning returns (mh, rmsup, top2_set)
         if len(result) == 3:
             local_mh, local_rmsup, _ = result
         else:
             local_mh, local_rmsup = result
-        
+
+        # Publish an improved threshold for workers that have not started yet
+        if shared_rmsup is not None:
+            with self._rmsup_lock:
+                if local_rmsup > shared_rmsup['value']:
+                    shared_rmsup['value'] = local_rmsup
+
         return local_mh, local_rmsup
     
     def _merge_results(
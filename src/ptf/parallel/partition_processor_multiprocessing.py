@@ -1,20 +1,22 @@
 """
 Multiprocessing Partition Processor for PTF Algorithm
 
-Implements partition-level parallelization using ProcessPoolExecutor.
-Each worker process processes a single prefix-based partition independently,
-bypassing Python's GIL for true parallel execution on multiple CPU cores.
+Implements partition-level parallelization using joblib's loky backend
+(same stack as the parallel co-occurrence step). Each worker process
+processes a single prefix-based partition independently, bypassing
+Python's GIL for true parallel execution on multiple CPU cores.
 
 Key Design:
 - True parallel execution (bypasses GIL)
 - Each process has independent memory space
-- Results are pickled and sent back to main process
+- loky reuses its worker pool across batches, so processes are spawned
+  once per interpreter instead of once per processor instance
 - Best for CPU-bound tasks
 """
 
 import os
-import concurrent.futures
 from typing import Tuple, List, Dict
+from joblib import Parallel, delayed
 from ptf.min_heap import MinHeapTopK
 
 
@@ -87,9 +89,8 @@ class MultiprocessingPartitionProcessor:
         """
         self.num_workers = num_workers or os.cpu_count() or 4
         self.partition_class = partition_class
-        self.process_pool = concurrent.futures.ProcessPoolExecutor(
-            max_workers=self.num_workers
-        )
+        self._parallel = Parallel(
+            n_jobs=self.num_workers, backend="loky")
     
     def process_partitions(
         self,
@@ -145,7 +146,14 @@ class MultiprocessingPartitionProcessor:
         if not work_items:
             # No partitions to process, return initial state
             return initial_min_heap, initial_rmsup
-        
+
+        # Largest-work-first (LPT) order so each batch mixes the
+        # expensive partitions early instead of leaving the biggest one
+        # as an end-of-run straggler
+        work_items.sort(
+            key=lambda w: len(w['partition_data']) * len(w['promising_items']),
+            reverse=True)
+
         # Initialize current state
         current_min_heap = initial_min_heap
         current_rmsup = initial_rmsup
@@ -163,25 +171,13 @@ class MultiprocessingPartitionProcessor:
                 work_item['initial_rmsup'] = current_rmsup
                 work_item['current_min_heap_itemsets'] = current_itemsets_dict
             
-            # Submit batch to process pool
-            futures = []
-            for work_item in batch:
-                future = self.process_pool.submit(
-                    _process_partition_worker,
-                    work_item,
-                    self.partition_class
-                )
-                futures.append(future)
-            
-            # Collect batch results
-            batch_results = []
-            for future in concurrent.futures.as_completed(futures):
-                try:
-                    itemsets_dict, local_rmsup = future.result()
-                    batch_results.append((itemsets_dict, local_rmsup))
-                except Exception as e:
-                    print(f"Worker process error: {e}")
-                    raise
+            # Dispatch batch to the loky worker pool; worker errors
+            # propagate from here
+            batch_results = self._parallel(
+                delayed(_process_partition_worker)(
+                    work_item, self.partition_class)
+                for work_item in batch
+            )
             
             # Merge batch results
             batch_min_heap, batch_rmsup = self._merge_results(
@@ -230,11 +226,13 @@ class MultiprocessingPartitionProcessor:
     
     def shutdown(self):
         """
-        Shutdown the process pool and wait for all processes to complete.
-        
-        Should be called after process_partitions() completes to cleanup resources.
+        Release processor resources.
+
+        loky manages a reusable executor shared across Parallel calls in
+        the interpreter, so there is no per-processor pool to tear down;
+        kept for API compatibility with callers' finally blocks.
         """
-        self.process_pool.shutdown(wait=True)
+        pass
     
     def __enter__(self):
         """Context manager entry"""
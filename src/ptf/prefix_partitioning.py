@@ -30,9 +30,12 @@ class PrefixPartitioning:
         return prefix_partitions
     
     def to_string(self):
-        result = ""
-        for prefix, suffixes in self.prefix_partitions.items():
-            result += f"Prefix: {prefix}\n"
+        # Single pass over sorted items + one join instead of
+        # per-suffix string concatenation (O(n^2) on large partitions)
+        lines = []
+        for prefix, suffixes in sorted(self.prefix_partitions.items()):
+            lines.append(f"Prefix: {prefix}")
             for suffix in suffixes:
-                result += f"  Suffix: {suffix}\n"
-        return result
+                lines.append(f"  Suffix: {suffix}")
+        lines.append("")
+        return "\n".join(lines)
@@ -1,3 +1,4 @@
+import io
 import time
 from typing import Optional
 from ptf.hybrid_vertical_storage.sgl_partition_hybrid import SglPartitionHybrid
@@ -10,7 +11,28 @@ from ptf.algorithm import PrefixPartitioningbasedTopKAlgorithm
 from ptf.utils import write_output, track_execution, MetricsReporter
 
 
-def run_ptf_algorithm(file_path: str, top_k: int = 8, output_file=None):
+def prepare_ptf_inputs(file_path: str):
+    """
+    Build the top_k-invariant inputs once: transaction database,
+    prefix partitioner and co-occurrence numbers.
+
+    Useful when sweeping several top_k values over the same dataset:
+    parse/partition/co-occurrence are independent of top_k and can be
+    shared across runs instead of being rebuilt each time.
+
+    Args:
+        file_path: Path to transaction database file
+
+    Returns:
+        Tuple (db, partitioner, co_occurrence_numbers)
+    """
+    db = TransactionDB(file_path)
+    partitioner = PrefixPartitioning(db)
+    co_occurrence_numbers = CoOccurrenceNumbers(partitioner, db)
+    return db, partitioner, co_occurrence_numbers
+
+
+def run_ptf_algorithm(file_path: str, top_k: int = 8, output_file=None, prepared=None):
     """
     Helper function to run PTF algorithm with given parameters.
     Writes output to file if output_file is provided.
@@ -19,24 +41,35 @@ def run_ptf_algorithm(file_path: str, top_k: int = 8, output_file=None):
         file_path: Path to transaction database file
         top_k: Number of top-k itemsets to find
         output_file: Optional file object to write results to
+        prepared: Optional (db, partitioner, co_occurrence_numbers) tuple
+                  from prepare_ptf_inputs() to skip the top_k-invariant stages
     """
+    # Accumulate report lines in memory and flush once at the end: one
+    # write instead of one syscall per line. Also on the stdout path -
+    # print per line grabs the stdio lock and flushes each time, which
+    # adds up over top_k result lines.
+    buffer = io.StringIO()
+
     with track_execution() as metrics:
         # Read transaction database
         # Tinh toan thoi gian chay chu toan nay den odan buildpromissing itmes.
 
-        db = TransactionDB(file_path)
-        start_time = time.time()
-        partitioner = PrefixPartitioning(db)
-        end_time = time.time()
-        write_output(
-            f"Build partitioner: {end_time - start_time:.4f} seconds", output_file)
+        if prepared is not None:
+            db, partitioner, co_occurrence_numbers = prepared
+        else:
+            db = TransactionDB(file_path)
+            start_time = time.time()
+            partitioner = PrefixPartitioning(db)
+            end_time = time.time()
+            write_output(
+                f"Build partitioner: {end_time - start_time:.4f} seconds", buffer)
 
-        start_time = time.time()
-        # co_occurrence_numbers = CoOccurrenceNumbersParallel(partitioner, db)
-        co_occurrence_numbers = CoOccurrenceNumbers(partitioner, db)
-        end_time = time.time()
-        write_output(
-            f"Compute co-occurrence numbers: {end_time - start_time:.4f} seconds", output_file)
+            start_time = time.time()
+            # co_occurrence_numbers = CoOccurrenceNumbersParallel(partitioner, db)
+            co_occurrence_numbers = CoOccurrenceNumbers(partitioner, db)
+            end_time = time.time()
+            write_output(
+                f"Compute co-occurrence numbers: {end_time - start_time:.4f} seconds", buffer)
         # Main algorithm
         ptf = PrefixPartitioningbasedTopKAlgorithm(
             k=top_k,
@@ -49,9 +82,9 @@ def run_ptf_algorithm(file_path: str, top_k: int = 8, output_file=None):
 
         end_time = time.time()
         write_output(
-            f"Initialize MH and RMSUP: {end_time - start_time:.4f} seconds", output_file)
-        write_output(f"Initial rmsup: {rmsup}", output_file)
-        write_output(f"Initial MH size: {len(min_heap.heap)}", output_file)
+            f"Initialize MH and RMSUP: {end_time - start_time:.4f} seconds", buffer)
+        write_output(f"Initial rmsup: {rmsup}", buffer)
+        write_output(f"Initial MH size: {len(min_heap.heap)}", buffer)
 
         start_time = time.time()
         promissing_arr = ptf.build_promissing_item_arrays(
@@ -61,7 +94,7 @@ def run_ptf_algorithm(file_path: str, top_k: int = 8, output_file=None):
             rmsup=rmsup
         )
         end_time = time.time()
-        write_output(f"Promissing array built: {promissing_arr}", output_file)
+        write_output(f"Promissing array built: {promissing_arr}", buffer)
 
         min_heap, rmsup = ptf.filter_partitions(
             promissing_arr=promissing_arr,
@@ -74,22 +107,37 @@ def run_ptf_algorithm(file_path: str, top_k: int = 8, output_file=None):
 
         # Print final results
         final_results = min_heap.get_all()
-        # Sort by support descending
-        final_results.sort(key=lambda x: (-x[0], x[1]))
+        # Sort by support descending, itemset ascending as tie-break.
+        # Negate once and sort key-less (C-level tuple compare) instead of
+        # calling a Python lambda per element.
+        final_results = [(-support, itemset)
+                         for support, itemset in final_results]
+        final_results.sort()
+        final_results = [(-support, itemset)
+                         for support, itemset in final_results]
 
         write_output(
-            f"\nTotal itemsets found: {len(final_results)}", output_file)
-        write_output(f"Final rmsup: {min_heap.min_support()}\n", output_file)
+            f"\nTotal itemsets found: {len(final_results)}", buffer)
+        write_output(f"Final rmsup: {min_heap.min_support()}\n", buffer)
 
+        # Itemsets in the heap are already sorted tuples (see
+        # initialize_mh_and_rmsup and the SglPartition variants), so no
+        # per-rank sorted() pass is needed here.
         for rank, (support, itemset) in enumerate(final_results, 1):
-            itemset_str = "{" + ", ".join(map(str, sorted(itemset))) + "}"
+            itemset_str = "{" + ", ".join(map(str, itemset)) + "}"
             write_output(
-                f"{rank}. {itemset_str:20} => Support: {support}", output_file)
+                f"{rank}. {itemset_str:20} => Support: {support}", buffer)
 
     # Generate execution report
     write_output(
-        f"Execution time: {metrics.execution_time_ms:.2f} ms", output_file)
-    write_output(f"Memory used: {metrics.memory_used_kb:.2f} KB", output_file)
+        f"Execution time: {metrics.execution_time_ms:.2f} ms", buffer)
+    write_output(f"Memory used: {metrics.memory_used_kb:.2f} KB", buffer)
+
+    report = buffer.getvalue()
+    if output_file:
+        output_file.write(report)
+    else:
+        print(report, end="")
 
 
 def run_ptf_algorithm_with_timing(file_path: str, top_k: int = 8, output_file=None, metrics_json: Optional[str] = None) -> float:
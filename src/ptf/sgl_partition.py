@@ -1,4 +1,6 @@
 import heapq
+from bisect import bisect_right
+from itertools import count
 from typing import List, Dict, Tuple, Set
 from ptf.min_heap import MinHeapTopK
 
@@ -114,39 +116,73 @@ class SglPartition:
 
         # PHASE 1: Initialize 2-itemsets
         # ============================================================
-        ht = {}  # Hash table: frozenset(itemset) -> tid_set
-        qe = []  # Priority queue (max-heap): [(-support, itemset), ...]
+        # Itemsets are tuples in AR_i order (prefix first). Extensions
+        # always append an item strictly AFTER the current last item in
+        # AR_i, so the tuple form is maintained incrementally: dropping
+        # the last item is key[:-1], extending is key + (y2,), and the
+        # last item's position rides along in the queue entry - no
+        # per-pop sort, no index lookup, no frozenset diff/union.
+        ht = {}  # Hash table: itemset tuple (AR_i order) -> tid_set
+        qe = []  # Priority queue (max-heap): [(-support, tie, itemset, last_pos), ...]
+
+        # Tie-breaker for equal supports: a fresh counter value per push
+        # means heap comparisons never fall through to the O(k)
+        # element-wise itemset tuple; ties pop in insertion order.
+        tie = count()
+        tie_next = tie.__next__
+
+        n = len(promising_items)
+
+        # AR_i positions whose Phase-1 pair survived, in ascending
+        # order. Every itemset that ever enters HT is built from these
+        # pairs, so Phase 2 only needs to try extension items from this
+        # list - dead positions would just miss the HT probe.
+        survivors = []
 
         # Create initial 2-itemsets from promising items
-        # For each pair (xi, xj) where xi is prefix and xj in AR_i
-        for j in range(1, len(promising_items)):
-            xj = promising_items[j]
-
-            # Get tid-sets for intersection
-            tidset_xi = tidset_map.get(partition_item, [])
-            tidset_xj = tidset_map.get(xj, [])
+        # For each pair (xi, xj) where xi is prefix and xj in AR_i.
+        # The prefix tidset is loop-invariant; if its own cardinality
+        # cannot beat rmsup, no pair can and Phase 1 is empty.
+        tidset_xi = tidset_map.get(partition_item, [])
+        tidset_map_get = tidset_map.get
+        if len(tidset_xi) > rmsup:
+            for j in range(1, n):
+                xj = promising_items[j]
+
+                # A pair's support cannot exceed either tidset's own
+                # length, so this O(1) check skips unviable items before
+                # the intersection
+                tidset_xj = tidset_map_get(xj)
+                if not tidset_xj or len(tidset_xj) <= rmsup:
+                    continue
 
-            if not tidset_xi or not tidset_xj:
-                continue
+                # Calculate tid-set intersection
+                tidset_pair = SglPartition._tidset_intersection(
+                    tidset_xi, tidset_xj)
+                support_pair = len(tidset_pair)
 
-            # Calculate tid-set intersection
-            tidset_pair = SglPartition._tidset_intersection(
-                tidset_xi, tidset_xj)
-            support_pair = len(tidset_pair)
+                if support_pair > rmsup:
+                    itemset_key = (partition_item, xj)
+                    ht[itemset_key] = tidset_pair
+                    survivors.append(j)
 
-            if support_pair > rmsup:
-                # Create itemset key (frozenset for hashing)
-                itemset_key = frozenset([partition_item, xj])
-                ht[itemset_key] = tidset_pair
+                    # Plain append; one heapify below builds the queue in
+                    # O(n) instead of n O(log n) pushes
+                    qe.append((-support_pair, tie_next(), itemset_key, j))
 
-                # Add to priority queue (use negative support for max-heap)
-                heapq.heappush(qe, (-support_pair, itemset_key))
+        heapq.heapify(qe)
 
         # PHASE 2: Main loop - Expand itemsets high-support-first
         # ============================================================
+        # Bind the heap's hot methods once: each insert/min_support call
+        # below otherwise pays an attribute lookup per candidate
+        min_heap_insert = min_heap.insert
+        min_heap_min_support = min_heap.min_support
+        ht_get = ht.get
+
         while qe:
             # Step 2.1: Pop itemset with maximum support
-            neg_support_rt, itemset_rt = heapq.heappop(qe)
+            neg_support_rt, _, itemset_rt, last_pos = heapq.heappop(qe)
             support_rt = -neg_support_rt
 
             # Step 2.2: Check termination condition
@@ -157,46 +193,35 @@ class SglPartition:
             # Step 2.3: Update MH if itemset size >= 3
             # Only 3+ itemsets are candidates for top-k
             if len(itemset_rt) >= 3:
-                # Convert frozenset back to sorted tuple for heap
+                # AR_i is normally value-ascending, so this sort is an
+                # O(k) already-sorted pass; it only reorders when a
+                # caller hands in an unsorted promising list
                 itemset_tuple = tuple(sorted(itemset_rt))
-                min_heap.insert(support=support_rt, itemset=itemset_tuple)
+                min_heap_insert(support=support_rt, itemset=itemset_tuple)
 
                 # Update rmsup (minimum support in top-k)
-                rmsup = min_heap.min_support()
+                rmsup = min_heap_min_support()
 
             # Step 2.4-2.9: Try extending itemset with remaining items
             # Only extend with items that come after last item in AR_i
-            itemset_list = sorted(list(itemset_rt))
-            last_item = itemset_list[-1]
-
-            try:
-                # Find position of last_item in promising_items
-                last_pos = promising_items.index(last_item)
-            except ValueError:
-                # last_item not in promising_items, skip
+            itemset_without_last = itemset_rt[:-1]
+            tidset_rt = ht[itemset_rt]
+            if not tidset_rt:
                 continue
 
-            # Try extending with items after last_pos in promising_items
-            for next_pos in range(last_pos + 1, len(promising_items)):
+            # Try extending with surviving positions after last_pos
+            for next_pos in survivors[bisect_right(survivors, last_pos):]:
                 y2 = promising_items[next_pos]
 
                 # Step 2.5: Check if X ∪ {y2} exists in HT
                 # where X = itemset_rt \ {last_item}
-                itemset_without_last = frozenset(itemset_rt - {last_item})
-                itemset_with_y2 = itemset_without_last | {y2}
-
-                # By Theorem 3: If itemset_with_y2 not in HT,
-                # then support(itemset_rt + {y2}) <= rmsup
-                if itemset_with_y2 not in ht:
+                # By Theorem 3: If it is absent,
+                # support(itemset_rt + {y2}) <= rmsup
+                tidset_last_y2 = ht_get(itemset_without_last + (y2,))
+                if not tidset_last_y2:
                     continue
 
                 # Step 2.6: Calculate tid-set intersection
-                tidset_last_y2 = ht.get(itemset_with_y2, [])
-                tidset_rt = ht.get(itemset_rt, [])
-
-                if not tidset_rt or not tidset_last_y2:
-                    continue
-
                 tidset_new = SglPartition._tidset_intersection(
                     tidset_rt, tidset_last_y2)
                 support_new = len(tidset_new)
@@ -204,34 +229,28 @@ class SglPartition:
                 # Step 2.7: Check support threshold
                 if support_new > rmsup:
                     # Step 2.8: Add new itemset to HT and QE
-                    itemset_new = itemset_rt | {y2}
+                    itemset_new = itemset_rt + (y2,)
                     ht[itemset_new] = tidset_new
-                    heapq.heappush(qe, (-support_new, itemset_new))
+                    heapq.heappush(
+                        qe, (-support_new, tie_next(), itemset_new, next_pos))
 
         return min_heap, rmsup
 
     @staticmethod
     def _tidset_intersection(tidset1: List[int], tidset2: List[int]) -> List[int]:
         '''
-        Efficient intersection of two sorted tid-lists using binary merge.
-
-        Both tid-sets should be pre-sorted in ascending order.
-        Time complexity: O(n + m) where n, m are sizes of tid-sets
-        '''
-        result = []
-        i, j = 0, 0
+        Intersection of two tid-lists via C-level set operations.
 
-        while i < len(tidset1) and j < len(tidset2):
-            if tidset1[i] == tidset2[j]:
-                result.append(tidset1[i])
-                i += 1
-                j += 1
-            elif tidset1[i] < tidset2[j]:
-                i += 1
-            else:
-                j += 1
+        The bytecode-level binary merge walked both lists one element per
+        interpreter step; building a set from the smaller list and probing
+        it with the larger one runs entirely in C. Output stays a sorted
+        list, as downstream code and callers expect.
 
-        return result
+        Time complexity: O(n + m) plus an O(r log r) sort of the result.
+        '''
+        if len(tidset1) > len(tidset2):
+            tidset1, tidset2 = tidset2, tidset1
+        return sorted(set(tidset1).intersection(tidset2))
 
     @staticmethod
     def build_vertical_representation(partition_data: List[List[int]], partition_item: int, promising_arr: List[int]) -> Tuple[Dict[int, List[int]], int]:
@@ -247,26 +266,34 @@ class SglPartition:
             tidset_map (Dict): Mapping from item to tid-set (list of transaction IDs)
             partition_size (int): Number of transactions in partition
         '''
-        tidset_map = {}
-
-        # Initialize tidset for all promising items
-        for item in promising_arr:
-            if item != partition_item:
-                tidset_map[item] = []
-            else:
-                # Prefix item appears in all transactions
-                tidset_map[item] = list(range(len(partition_data)))
-
-        # Assign local TID and build tidsets
+        # Probe dict over the suffix items only: the prefix never needs a
+        # scan (it appears in every transaction), and leaving it out of
+        # the dict removes the per-item prefix comparison from the hot
+        # loop entirely.
+        suffix_tidsets = {item: []
+                          for item in promising_arr if item != partition_item}
+
+        # Assign local TID and build tidsets. dict.get resolves membership
+        # and lookup in a single hash probe instead of the two that
+        # `item in map` + `map[item]` cost per matching item.
+        suffix_tidsets_get = suffix_tidsets.get
         for local_tid, transaction in enumerate(partition_data):
             for item in transaction:
-                if item in tidset_map and item != partition_item:
-                    tidset_map[item].append(local_tid)
+                tidset = suffix_tidsets_get(item)
+                if tidset is not None:
+                    tidset.append(local_tid)
 
-        # Sort tidsets for efficient intersection operations
-        for item in tidset_map:
-            tidset_map[item].sort()
+        # Tidsets are already sorted: local_tid is appended in increasing
+        # enumeration order (and the prefix tidset is a range), so no
+        # per-item sort pass is needed.
 
         partition_size = len(partition_data)
 
+        # Reassemble in promising_arr order, prefix tidset included
+        tidset_map = {
+            item: (list(range(partition_size)) if item == partition_item
+                   else suffix_tidsets[item])
+            for item in promising_arr
+        }
+
         return tidset_map, partition_size
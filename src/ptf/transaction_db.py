@@ -1,8 +1,9 @@
+import sys
 from typing import List, Dict, Set, Tuple
 
 '''
 Mục tiêu:
-- Đọc dữ liệu transaction từ file text.
+- Đọc dữ liệu transaction từ file text (hoặc stdin khi file_path="-").
 
 Example usage:
     transaction_db = TransactionDB('path/to/transactions.txt')
@@ -18,30 +19,37 @@ class TransactionDB:
 
     def load_transactions(self, file_path) -> Tuple[List[List[int]], Set[int]]:
         try:
-            with open(file_path, 'r') as file:
-                for line_num, line in enumerate(file, 1):
-                    line = line.strip()
+            if file_path == "-":
+                # Stream from stdin (e.g. piped preprocessing output)
+                self._parse_lines(sys.stdin)
+            else:
+                with open(file_path, 'r') as file:
+                    self._parse_lines(file)
 
-                    if not line:
-                        continue
+        except FileNotFoundError as e:
+            raise FileNotFoundError(f"File not found: {file_path}") from e
 
-                    try:
-                        items = list(map(int, line.split()))
-                        # Paper: Without loss of generality, let x1 ≺ x2 ≺ … ≺ xd, the items are arranged in alphabetical order
-                        items_sorted = sorted(items)
-                        self.transactions.append(items_sorted)
+        return self.transactions, self.all_items
 
-                        for item in items_sorted:
-                            self.all_items.add(item)
+    def _parse_lines(self, lines):
+        for line_num, line in enumerate(lines, 1):
+            line = line.strip()
 
-                    except ValueError as e:
-                        raise ValueError(
-                            f"Invalid format on line {line_num}: {line}") from e
+            if not line:
+                continue
 
-        except FileNotFoundError as e:
-            raise FileNotFoundError(f"File not found: {file_path}") from e
+            try:
+                items = list(map(int, line.split()))
+                # Paper: Without loss of generality, let x1 ≺ x2 ≺ … ≺ xd, the items are arranged in alphabetical order
+                items_sorted = sorted(items)
+                self.transactions.append(items_sorted)
 
-        return self.transactions, self.all_items
+                for item in items_sorted:
+                    self.all_items.add(item)
+
+            except ValueError as e:
+                raise ValueError(
+                    f"Invalid format on line {line_num}: {line}") from e
 
     def to_string(self):
         result = ""
@@ -133,11 +133,11 @@ class TestCoOccurrenceNumbers:
         counts = [count for _, count in con_list]
         assert counts == [3, 2, 1]
 
-        # Verify itemsets are sets
+        # Verify itemsets are canonical (sorted) tuples
         itemsets = [itemset for itemset, _ in con_list]
-        assert {1} in itemsets
-        assert {1, 2} in itemsets
-        assert {1, 3} in itemsets
+        assert (1,) in itemsets
+        assert (1, 2) in itemsets
+        assert (1, 3) in itemsets
 
     def test_merge_partition_con_multiple_prefixes(self, mock_prefix_partition, mock_transaction_db):
         """Test _merge_partition_con with multiple prefixes."""
@@ -222,9 +222,9 @@ class TestCoOccurrenceNumbers:
             counts = [count for _, count in con_list]
             assert counts == sorted(counts, reverse=True)
 
-            # Check that all results are tuples of (set, int)
+            # Check that all results are tuples of (tuple, int)
             for itemset, count in con_list:
-                assert isinstance(itemset, set)
+                assert isinstance(itemset, tuple)
                 assert isinstance(count, int)
 
     def test_compute_co_occurrence_numbers_sorting(self, mock_prefix_partition, mock_transaction_db):
@@ -277,8 +277,8 @@ class TestCoOccurrenceNumbers:
         assert result['b']['d'] == 1
         assert result['b']['e'] == 2
 
-    def test_merge_partition_con_frozenset_creation(self, mock_prefix_partition, mock_transaction_db):
-        """Test that _merge_partition_con correctly creates sets."""
+    def test_merge_partition_con_canonical_tuple_creation(self, mock_prefix_partition, mock_transaction_db):
+        """Test that _merge_partition_con correctly creates canonical tuples."""
         mock_prefix_partition.prefix_partitions = {}
 
         co_occ = CoOccurrenceNumbers(
@@ -291,14 +291,14 @@ class TestCoOccurrenceNumbers:
         result_dict, result_list = co_occ._merge_partition_con(
             partition_con_dict)
 
-        # Check set structure
+        # Check canonical tuple structure
         assert 'x' in result_dict
         con_list = result_dict['x']
         itemsets = [itemset for itemset, _ in con_list]
 
-        assert {'x'} in itemsets
-        assert {'x', 'y'} in itemsets
-        assert {'x', 'z'} in itemsets
+        assert ('x',) in itemsets
+        assert ('x', 'y') in itemsets
+        assert ('x', 'z') in itemsets
 
     def test_empty_all_partitions(self, mock_prefix_partition, mock_transaction_db):
         """Test with all empty partitions."""